@@ -10,9 +10,9 @@ import asyncio
 from pathlib import Path
 from typing import Optional
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import click
-import numpy as np
 from loguru import logger
 from dotenv import load_dotenv
 
@@ -21,6 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.audio.capture import AudioCapture
 from src.audio.wake_word import WakeWordDetector
+from src.audio.dsp_kernels import rms_and_zcr
 from src.stt.whisper_adapter import WhisperSTT
 from src.nlu.parser import IntentParser
 from src.router.dispatcher import CommandDispatcher
@@ -44,6 +45,9 @@ class LogicVoiceControl:
         self.running = False
         self.verbose = verbose
         
+        # Running noise floor estimate (RMS relative to full scale)
+        self._noise_floor = 0.01
+        
         # Setup logging
         log_level = "DEBUG" if verbose else "INFO"
         logger.remove()
@@ -75,43 +79,49 @@ class LogicVoiceControl:
     def _init_components(self):
         """Initialize all system components"""
         try:
-            # Audio capture - unified to 16kHz
-            buffer_size = 128 if self.low_latency else 512
-            self.audio_capture = AudioCapture(
-                device_name=self.config.audio.input_device,
-                sample_rate=16000,  # Force 16kHz for Whisper compatibility
-                channels=self.config.audio.channels,
-                buffer_size=buffer_size
-            )
-            
-            # Wake word detector
-            self.wake_word = WakeWordDetector(
-                models=self.config.wake_word.models,
-                threshold=self.config.wake_word.threshold
-            )
-            
-            # Speech-to-text
-            logger.info(f"📊 Loading Whisper model: {self.config.stt.model}")
-            self.stt = WhisperSTT(
-                model_size=self.config.stt.model,
-                language=self.config.stt.language
-            )
-            
-            # Intent parser with commands from config
-            self.intent_parser = IntentParser(
-                commands_config=self.config.commands.custom_commands
-            )
-            
-            # Command dispatcher
-            self.dispatcher = CommandDispatcher(
-                dry_run=self.dry_run
-            )
-            
-            # Feedback system
-            self.tts = TTSFeedback(
-                voice=self.config.feedback.voice,
-                rate=self.config.feedback.rate
-            )
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Speech-to-text - loads in the background while the rest starts up
+                logger.info(f"📊 Loading Whisper model: {self.config.stt.model}")
+                stt_future = executor.submit(
+                    WhisperSTT,
+                    model_size=self.config.stt.model,
+                    language=self.config.stt.language
+                )
+                
+                # Audio capture - unified to 16kHz
+                buffer_size = 128 if self.low_latency else 512
+                self.audio_capture = AudioCapture(
+                    device_name=self.config.audio.input_device,
+                    sample_rate=16000,  # Force 16kHz for Whisper compatibility
+                    channels=self.config.audio.channels,
+                    buffer_size=buffer_size
+                )
+                
+                # Wake word detector
+                self.wake_word = WakeWordDetector(
+                    models=self.config.wake_word.models,
+                    threshold=self.config.wake_word.threshold,
+                    audio_models=self.config.wake_word.audio_models,
+                    audio_threshold=self.config.wake_word.audio_threshold
+                )
+                
+                # Intent parser with commands from config
+                self.intent_parser = IntentParser(
+                    commands_config=self.config.commands.custom_commands
+                )
+                
+                # Command dispatcher
+                self.dispatcher = CommandDispatcher(
+                    dry_run=self.dry_run
+                )
+                
+                # Feedback system
+                self.tts = TTSFeedback(
+                    voice=self.config.feedback.voice,
+                    rate=self.config.feedback.rate
+                )
+                
+                self.stt = stt_future.result()
             
             logger.success("✅ All components initialized successfully")
             
@@ -136,11 +146,17 @@ class LogicVoiceControl:
         logger.info("")
         
         # Audio processing parameters
-        energy_threshold = 0.02  # Increased threshold - need louder audio
+        min_energy = 0.01  # RMS relative to full scale - never gate below this
         check_interval = 1.0  # Check less frequently (every 1 second)
-        last_check_time = 0
-        audio_buffer = []
+        last_check_time = 0.0
+        sample_rate = self.audio_capture.sample_rate
+        window_samples = int(0.5 * sample_rate)  # Analyze the last 0.5 seconds
+        min_samples = 4 * self.audio_capture.buffer_size
+        # Bias Whisper towards the wake words, e.g. "Hey logic. Computer."
+        wake_prompt = " ".join(f"{w.capitalize()}." for w in self.wake_word.get_wake_words())
         checks_count = 0
+        stt_task: Optional[asyncio.Task] = None  # Wake word transcription in flight
+        use_audio_model = self.wake_word.has_audio_model
         
         try:
             while self.running:
@@ -151,117 +167,88 @@ class LogicVoiceControl:
                     await asyncio.sleep(0.01)
                     continue
                 
-                # Add to buffer
-                audio_buffer.append(audio_chunk)
+                # Acoustic wake word model: runs on every chunk, Whisper only for commands
+                if use_audio_model:
+                    detected = self.wake_word.detect_in_audio(audio_chunk)
+                    self.audio_capture.release_chunk(audio_chunk)
+                    if detected:
+                        await self._handle_wake_word()
+                    continue
+                
+                # The transcription path reads samples from the ring buffer instead
+                self.audio_capture.release_chunk(audio_chunk)
                 
-                # Keep buffer size manageable (last 2 seconds)
-                max_buffer_chunks = int(2.0 * 16000 / self.audio_capture.buffer_size)
-                if len(audio_buffer) > max_buffer_chunks:
-                    audio_buffer.pop(0)
+                # Pick up a finished wake word transcription
+                if stt_task is not None and stt_task.done():
+                    text = stt_task.result()
+                    stt_task = None
+                    
+                    if text:
+                        logger.info(f"📝 Heard: '{text}'")
+                        
+                        # Check if wake word is in the transcription
+                        if self.wake_word.detect_in_text(text):
+                            await self._handle_wake_word()
+                            checks_count = 0
+                        else:
+                            if self.verbose:
+                                logger.debug(f"❌ No wake word in: '{text}'")
+                
+                # Recent audio is kept in the capture ring buffer
+                if self.audio_capture.buffered_samples < min_samples:
+                    continue
                 
                 # Check if enough time has passed for wake word check
-                current_time = time.time()
+                current_time = time.monotonic()
                 if current_time - last_check_time < check_interval:
                     continue
                 
                 last_check_time = current_time
-                
-                # Combine buffer for analysis
-                if len(audio_buffer) < 4:  # Need at least 0.25 seconds
-                    continue
                     
-                combined_audio = np.concatenate(audio_buffer[-8:])  # Last 0.5 seconds
+                combined_audio = self.audio_capture.get_recent_audio(window_samples)
                 
                 # Check audio energy (efficiency optimization)
-                audio_energy = np.sqrt(np.mean(combined_audio ** 2))
+                # RMS and zero crossings come from one fused pass over the int16 samples
+                rms, zero_crossings = rms_and_zcr(combined_audio)
+                audio_energy = rms / 32768.0
                 
                 # Show periodic status
                 checks_count += 1
                 if checks_count % 10 == 0:  # Every 10 seconds
                     logger.info(f"⏳ Still listening... (checked {checks_count} times)")
                 
+                # Adaptive gate: audio must stand out from the noise floor (EMA)
+                energy_threshold = max(self._noise_floor * 3, min_energy)
+                self._noise_floor = 0.95 * self._noise_floor + 0.05 * audio_energy
+                
                 if audio_energy < energy_threshold:
                     if self.verbose:
-                        logger.debug(f"🔇 Too quiet (energy: {audio_energy:.4f} < {energy_threshold})")
+                        logger.debug(
+                            f"🔇 Too quiet (energy: {audio_energy:.4f} < {energy_threshold:.4f}, "
+                            f"zero crossings: {zero_crossings})"
+                        )
                     continue  # Too quiet, skip processing
                 
+                # Whisper is still busy with the previous window - skip this one
+                if stt_task is not None:
+                    continue
+                
                 # Show activity indicator
                 logger.info(f"🎤 Audio detected (energy: {audio_energy:.4f}) - checking for wake word...")
                 
                 # Check for wake word (only when there's sufficient audio energy)
-                # Transcribe the audio
-                text = self.stt.transcribe(combined_audio, sample_rate=16000)
-                
-                if text:
-                    logger.info(f"📝 Heard: '{text}'")
-                    
-                    # Check if wake word is in the transcription
-                    if self.wake_word.detect_in_text(text):
-                        logger.success("=" * 50)
-                        logger.success("🎯 WAKE WORD DETECTED!")
-                        logger.success("=" * 50)
-                        
-                        # Clear buffer after wake word
-                        audio_buffer.clear()
-                        
-                        # Provide feedback
-                        await self.tts.speak_async("Ja, ich höre")
-                        
-                        # Capture command
-                        logger.info("🎤 Listening for command...")
-                        logger.info("💬 Available commands: Test, Hallo, Zeit, Hilfe, Stop")
-                        
-                        command_audio = await self.audio_capture.capture_command(
-                            max_duration=5.0,
-                            silence_timeout=1.5
-                        )
-                        
-                        if len(command_audio) > 0:
-                            # Transcribe command
-                            command_text = self.stt.transcribe(command_audio, sample_rate=16000)
-                            
-                            if command_text:
-                                logger.info(f"📝 Command: '{command_text}'")
-                                
-                                # Parse intent
-                                intent = self.intent_parser.parse(command_text)
-                                
-                                if intent:
-                                    logger.info(f"🎯 Intent: {intent.name} ({intent.confidence:.2f})")
-                                    
-                                    # Execute command
-                                    result = await self.dispatcher.execute_async(intent)
-                                    
-                                    # Provide feedback
-                                    if result.success:
-                                        await self.tts.speak_async(result.feedback)
-                                        logger.success(f"✅ {result.feedback}")
-                                        
-                                        # Check for exit command
-                                        if intent.action == "exit":
-                                            logger.info("👋 Exit command received, shutting down...")
-                                            self.running = False
-                                    else:
-                                        await self.tts.speak_async(f"Fehler: {result.error}")
-                                        logger.error(f"❌ {result.error}")
-                                else:
-                                    await self.tts.speak_async("Befehl nicht verstanden")
-                                    logger.warning("⚠️ No intent matched")
-                            else:
-                                await self.tts.speak_async("Nichts gehört")
-                                logger.warning("⚠️ No command transcribed")
-                        else:
-                            logger.warning("⚠️ No command audio captured")
-                        
-                        # Reset for next wake word
-                        logger.info("")
-                        logger.info("=" * 50)
-                        logger.info("👂 Listening for wake word again...")
-                        logger.info("=" * 50)
-                        checks_count = 0
-                    else:
-                        if self.verbose:
-                            logger.debug(f"❌ No wake word in: '{text}'")
+                # Transcribe on a worker thread so audio keeps draining meanwhile.
+                # Whisper reads the pre-normalized float32 mirror, as a detached
+                # array so the callback cannot overwrite it mid-transcription
+                whisper_audio = self.audio_capture.get_recent_audio(
+                    window_samples, normalized=True, copy=True
+                )
+                stt_task = asyncio.create_task(asyncio.to_thread(
+                    self.stt.transcribe,
+                    whisper_audio,
+                    sample_rate,
+                    wake_prompt
+                ))
                 
                 # Small delay
                 await asyncio.sleep(0.01)
@@ -275,11 +262,80 @@ class LogicVoiceControl:
         finally:
             await self.cleanup()
     
+    async def _handle_wake_word(self):
+        """Acknowledge the wake word, then capture and execute one command"""
+        logger.success("=" * 50)
+        logger.success("🎯 WAKE WORD DETECTED!")
+        logger.success("=" * 50)
+        
+        # Clear buffer after wake word
+        self.audio_capture.clear_recent_audio()
+        
+        # Provide feedback
+        await self.tts.speak_async("Ja, ich höre")
+        
+        # Capture command
+        logger.info("🎤 Listening for command...")
+        logger.info("💬 Available commands: Test, Hallo, Zeit, Hilfe, Stop")
+        
+        command_audio = await self.audio_capture.capture_command(
+            max_duration=5.0,
+            silence_timeout=1.5
+        )
+        
+        # The command itself must not retrigger the wake word
+        self.audio_capture.clear_recent_audio()
+        
+        if len(command_audio) > 0:
+            # Transcribe command (off the event loop)
+            command_text = await asyncio.to_thread(self.stt.transcribe, command_audio, 16000)
+        
+            if command_text:
+                logger.info(f"📝 Command: '{command_text}'")
+        
+                # Parse intent
+                intent = self.intent_parser.parse(command_text)
+        
+                if intent:
+                    logger.info(f"🎯 Intent: {intent.name} ({intent.confidence:.2f})")
+        
+                    # Execute command
+                    result = await self.dispatcher.execute_async(intent)
+        
+                    # Provide feedback
+                    if result.success:
+                        await self.tts.speak_async(result.feedback)
+                        logger.success(f"✅ {result.feedback}")
+        
+                        # Check for exit command
+                        if intent.action == "exit":
+                            logger.info("👋 Exit command received, shutting down...")
+                            self.running = False
+                    else:
+                        await self.tts.speak_async(f"Fehler: {result.error}")
+                        logger.error(f"❌ {result.error}")
+                else:
+                    await self.tts.speak_async("Befehl nicht verstanden")
+                    logger.warning("⚠️ No intent matched")
+            else:
+                await self.tts.speak_async("Nichts gehört")
+                logger.warning("⚠️ No command transcribed")
+        else:
+            logger.warning("⚠️ No command audio captured")
+        
+        # Reset for next wake word, dropping the spoken feedback as well
+        self.audio_capture.clear_recent_audio()
+        logger.info("")
+        logger.info("=" * 50)
+        logger.info("👂 Listening for wake word again...")
+        logger.info("=" * 50)
+    
     async def cleanup(self):
         """Clean up resources"""
         self.running = False
         self.audio_capture.stop_stream()
         await self.audio_capture.stop()
+        self.tts.close()
         logger.info("👋 Logic Voice Control stopped")
     
     def handle_signal(self, signum, frame):
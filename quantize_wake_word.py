@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Wake Word Model Quantizer
+Converts an openWakeWord ONNX model to int8 weights for faster inference
+"""
+
+import sys
+from pathlib import Path
+
+import click
+from loguru import logger
+
+
+@click.command()
+@click.argument(
+    'model_path',
+    type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    '--output',
+    '-o',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Output path (default: <model>_int8.onnx)'
+)
+def main(model_path, output):
+    """
+    Quantize a custom ONNX wake word model to int8
+    
+    Weights are quantized per channel with reduced range, which keeps
+    accuracy on CPUs without VNNI support.
+    
+    Examples:
+        python quantize_wake_word.py models/hey_logic.onnx
+        python quantize_wake_word.py models/hey_logic.onnx -o models/hey_logic_q.onnx
+    """
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        logger.error("❌ onnxruntime not installed (pip install onnxruntime)")
+        sys.exit(1)
+    
+    output = output or model_path.with_name(f"{model_path.stem}_int8.onnx")
+    
+    logger.info(f"🔧 Quantizing {model_path} -> {output}")
+    quantize_dynamic(
+        model_path,
+        output,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+        reduce_range=True
+    )
+    
+    size_before = model_path.stat().st_size / 1024
+    size_after = output.stat().st_size / 1024
+    logger.success(f"✅ Saved int8 model ({size_before:.0f} KB -> {size_after:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
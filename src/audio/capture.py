@@ -5,16 +5,24 @@ Handles microphone input and audio processing for voice control
 """
 
 import asyncio
+import ctypes
+import sys
 import numpy as np
+from collections import deque
 from typing import Optional, Generator, Any
 from dataclasses import dataclass
 import threading
-import queue
 
 import pyaudio
 import webrtcvad
 from loguru import logger
 
+# Scale factor from int16 samples to float32 in [-1, 1)
+INT16_TO_FLOAT = np.float32(1.0 / 32768.0)
+
+# macOS QoS class for latency-critical threads (<sys/qos.h>)
+QOS_CLASS_USER_INTERACTIVE = 0x21
+
 
 @dataclass
 class AudioConfig:
@@ -54,8 +62,33 @@ class AudioCapture:
         self._audio = None
         self._stream = None
         self._is_recording = False
-        self._audio_queue = queue.Queue()
+        self._callback_qos_set = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._vad = webrtcvad.Vad(2)  # Aggressiveness level 0-3
+        self._vad_frame_size = int(sample_rate * 30 / 1000)  # 30 ms VAD frames
+        
+        # Ring buffer with the most recent 2 seconds of audio (written by the callback),
+        # mirrored as normalized float32 so Whisper needs no conversion pass
+        self._ring = np.zeros(2 * sample_rate * channels, dtype=np.int16)
+        self._ring_f32 = np.zeros(len(self._ring), dtype=np.float32)
+        self._ring_pos = 0
+        
+        # Single-producer/single-consumer cursors over the ring: total samples
+        # written by the callback (head) and read by capture_async (tail).
+        # Each side only writes its own cursor, so no lock is needed under the GIL.
+        self._chunk_samples = buffer_size * channels
+        self._head = 0
+        self._tail = 0
+        self._clear_head = 0  # Head at the last clear_recent_audio(), set by the consumer
+        self._max_lag = max(1, len(self._ring) // self._chunk_samples - 1) * self._chunk_samples
+        self._consumer_waiting = False
+        self._data_ready = asyncio.Event()
+        
+        # Reusable chunk buffers; consumers hand them back with release_chunk()
+        self._pool_size = 8
+        self._pool = deque(
+            np.empty(self._chunk_samples, dtype=np.int16) for _ in range(self._pool_size)
+        )
         
         logger.info(f"🎤 Initializing audio capture (device: {device_name or 'default'})")
         
@@ -107,6 +140,9 @@ class AudioCapture:
             return
         
         try:
+            # The PortAudio thread wakes consumers on this loop
+            self._loop = asyncio.get_running_loop()
+            
             self._stream = self._audio.open(
                 format=pyaudio.paInt16,
                 channels=self.channels,
@@ -138,36 +174,147 @@ class AudioCapture:
     
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """PyAudio callback for incoming audio"""
+        if not self._callback_qos_set:
+            self._callback_qos_set = True
+            _raise_thread_qos()
+        
         if status:
             logger.warning(f"⚠️ Audio callback status: {status}")
         
-        # Convert to numpy array
-        audio_data = np.frombuffer(in_data, dtype=np.int16)
+        # View the raw bytes as samples (no copy)
+        samples = np.frombuffer(in_data, dtype=np.int16)
         
-        # Add to queue for processing
-        if not self._audio_queue.full():
-            self._audio_queue.put(audio_data)
+        # Publish into the ring buffer (advances the head cursor)
+        self._write_ring(samples)
+        
+        # Wake the consumer only if it is parked waiting for data
+        if self._consumer_waiting:
+            try:
+                self._loop.call_soon_threadsafe(self._data_ready.set)
+            except RuntimeError:
+                pass  # Event loop already closed
         
         return (None, pyaudio.paContinue)
     
+    def _read_chunk(self) -> Optional[np.ndarray]:
+        """Copy the next unread chunk out of the ring buffer into a pooled buffer"""
+        head = self._head
+        if head == self._tail:
+            return None
+        
+        # Far behind: the callback is about to overwrite unread audio, drop the oldest
+        if head - self._tail > self._max_lag:
+            logger.debug(f"⚠️ Audio consumer overrun, dropping {head - self._tail - self._max_lag} samples")
+            self._tail = head - self._max_lag
+        
+        n = min(self._chunk_samples, head - self._tail)
+        try:
+            chunk = self._pool.popleft()
+        except IndexError:
+            chunk = np.empty(self._chunk_samples, dtype=np.int16)
+        
+        size = len(self._ring)
+        start = self._tail % size
+        first = min(n, size - start)
+        chunk[:first] = self._ring[start:start + first]
+        chunk[first:n] = self._ring[:n - first]
+        self._tail += n
+        
+        return chunk if n == self._chunk_samples else chunk[:n]
+    
+    def release_chunk(self, chunk: np.ndarray):
+        """
+        Return a chunk from capture_async/get_audio_chunk to the buffer pool
+        
+        The chunk must not be used after releasing it, it will be overwritten
+        by a later read.
+        """
+        if chunk.size == self._chunk_samples and len(self._pool) < self._pool_size:
+            self._pool.append(chunk)
+    
+    def _write_ring(self, audio_data: np.ndarray):
+        """Copy audio into both ring buffers, wrapping around at the end"""
+        size = len(self._ring)
+        n = len(audio_data)
+        written = n
+        
+        if n >= size:
+            # Keep the newest samples, ending where the head cursor will be
+            audio_data = audio_data[-size:]
+            n = size
+            pos = (self._ring_pos + written - size) % size
+        else:
+            pos = self._ring_pos
+        
+        first = min(n, size - pos)
+        for start, segment in ((pos, audio_data[:first]), (0, audio_data[first:])):
+            end = start + len(segment)
+            self._ring[start:end] = segment
+            np.multiply(segment, INT16_TO_FLOAT, out=self._ring_f32[start:end])
+        
+        self._ring_pos = (pos + n) % size
+        
+        # Publish only after the samples are in place
+        self._head += written
+    
+    @property
+    def buffered_samples(self) -> int:
+        """Number of valid samples in the ring buffer"""
+        return min(len(self._ring), self._head - self._clear_head)
+    
+    def get_recent_audio(self, num_samples: int, normalized: bool = False,
+                         copy: bool = False) -> np.ndarray:
+        """
+        Get the most recent audio from the ring buffer
+        
+        Args:
+            num_samples: Number of samples to return (capped at what is buffered)
+            normalized: Return float32 samples in [-1, 1) instead of int16
+            copy: Always return an array detached from the ring buffer
+            
+        Returns:
+            Audio data as numpy array. Without copy, unless the window wraps
+            around, this is a view into the live ring buffer that the next
+            audio callback may overwrite.
+        """
+        ring = self._ring_f32 if normalized else self._ring
+        num_samples = min(num_samples, self.buffered_samples)
+        pos = self._ring_pos
+        start = pos - num_samples
+        
+        if start >= 0:
+            return ring[start:pos].copy() if copy else ring[start:pos]
+        return np.concatenate((ring[start:], ring[:pos]))
+    
+    def clear_recent_audio(self):
+        """
+        Discard the ring buffer contents
+        
+        Only snapshots the head cursor, the callback keeps sole ownership of
+        the ring state, so a concurrent write cannot undo the reset.
+        """
+        self._clear_head = self._head
+    
     def get_audio_chunk(self) -> Optional[np.ndarray]:
         """Get next audio chunk (non-blocking)"""
-        try:
-            return self._audio_queue.get_nowait()
-        except queue.Empty:
-            return None
+        return self._read_chunk()
     
     async def capture_async(self, timeout: float = 0.1) -> Optional[np.ndarray]:
         """Async audio capture"""
-        loop = asyncio.get_event_loop()
-        
-        def _get_chunk():
+        if self._head == self._tail:
+            # Park until the callback publishes more audio. The flag is raised
+            # before re-checking the head so a concurrent write cannot be missed.
+            self._data_ready.clear()
+            self._consumer_waiting = True
             try:
-                return self._audio_queue.get(timeout=timeout)
-            except queue.Empty:
+                if self._head == self._tail:
+                    await asyncio.wait_for(self._data_ready.wait(), timeout)
+            except asyncio.TimeoutError:
                 return None
+            finally:
+                self._consumer_waiting = False
         
-        return await loop.run_in_executor(None, _get_chunk)
+        return self._read_chunk()
     
     def is_speech(self, audio_data: np.ndarray) -> bool:
         """
@@ -181,8 +328,7 @@ class AudioCapture:
         """
         try:
             # VAD requires specific frame sizes (10, 20, or 30 ms)
-            frame_duration = 30  # ms
-            frame_size = int(self.sample_rate * frame_duration / 1000)
+            frame_size = self._vad_frame_size
             
             # Ensure we have enough data
             if len(audio_data) < frame_size:
@@ -201,6 +347,14 @@ class AudioCapture:
             logger.debug(f"VAD error: {e}")
             return False
     
+    def _is_speech_frame(self, frame: memoryview) -> bool:
+        """Run WebRTC VAD on one 10/20/30 ms frame of int16 bytes"""
+        try:
+            return self._vad.is_speech(frame, self.sample_rate)
+        except Exception as e:
+            logger.debug(f"VAD error: {e}")
+            return False
+    
     async def capture_command(
         self,
         max_duration: float = 5.0,
@@ -218,26 +372,50 @@ class AudioCapture:
         """
         logger.info("🎤 Listening for command...")
         
-        frames = []
         silent_chunks = 0
         max_silent_chunks = int(silence_timeout * self.sample_rate / self.buffer_size)
         max_chunks = int(max_duration * self.sample_rate / self.buffer_size)
         
+        # Chunks are copied here so their pooled buffers can be reused right away
+        audio_data = np.empty(max_chunks * self._chunk_samples, dtype=np.int16)
+        pos = 0
+        
+        # VAD runs over whole 30 ms frames of the buffer through a zero-copy byte view
+        frame_size = self._vad_frame_size
+        audio_bytes = memoryview(audio_data).cast('B')
+        vad_pos = 0
+        last_speech = False
+        
         chunk_count = 0
         speech_detected = False
         
         while chunk_count < max_chunks:
+            # Wakes as soon as the callback delivers a chunk
             chunk = await self.capture_async(timeout=0.1)
             
             if chunk is None:
-                await asyncio.sleep(0.01)
                 continue
             
-            frames.append(chunk)
+            n = min(len(chunk), len(audio_data) - pos)
+            audio_data[pos:pos + n] = chunk[:n]
+            pos += n
             chunk_count += 1
             
-            # Check for speech
-            if self.is_speech(chunk):
+            self.release_chunk(chunk)
+            
+            # Check for speech in all frames completed by this chunk; chunks
+            # shorter than a frame keep the previous decision
+            new_frames = 0
+            new_speech = False
+            while vad_pos + frame_size <= pos:
+                frame = audio_bytes[2 * vad_pos:2 * (vad_pos + frame_size)]
+                new_speech = self._is_speech_frame(frame) or new_speech
+                vad_pos += frame_size
+                new_frames += 1
+            if new_frames:
+                last_speech = new_speech
+            
+            if last_speech:
                 speech_detected = True
                 silent_chunks = 0
                 logger.debug("🗣️ Speech detected")
@@ -247,12 +425,11 @@ class AudioCapture:
                     
                     # Stop if we've been silent long enough
                     if silent_chunks >= max_silent_chunks:
-                        logger.info(f"🔇 Silence detected, stopping after {len(frames)} chunks")
+                        logger.info(f"🔇 Silence detected, stopping after {chunk_count} chunks")
                         break
         
-        # Combine all frames
-        if frames:
-            audio_data = np.concatenate(frames)
+        if pos > 0:
+            audio_data = audio_data[:pos]
             logger.info(f"🎵 Captured {len(audio_data)} samples ({len(audio_data)/self.sample_rate:.2f}s)")
             return audio_data
         else:
@@ -299,6 +476,18 @@ class AudioCapture:
 
 
 # Utility functions
+def _raise_thread_qos():
+    """Give the calling thread user-interactive QoS on macOS so inference threads don't starve it"""
+    if sys.platform != "darwin":
+        return
+    
+    try:
+        libsystem = ctypes.CDLL("/usr/lib/libSystem.B.dylib")
+        libsystem.pthread_set_qos_class_self_np(QOS_CLASS_USER_INTERACTIVE, 0)
+    except Exception as e:
+        logger.debug(f"Could not set audio thread QoS: {e}")
+
+
 def list_audio_devices():
     """List all available audio input devices"""
     audio = pyaudio.PyAudio()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+DSP Kernels
+Fused audio statistics for the wake word loop and test tools, compiled with Numba when available
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+# Numba is optional - the NumPy fallback gives the same results
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _rms_and_zcr_loop(audio_data: np.ndarray) -> Tuple[float, int]:
+    """
+    Single pass over the samples computing RMS and zero crossings
+
+    Args:
+        audio_data: Audio samples (int16 or float)
+
+    Returns:
+        Tuple of (RMS in sample units, number of sign changes)
+    """
+    n = len(audio_data)
+    if n == 0:
+        return 0.0, 0
+
+    sum_squares = 0.0
+    crossings = 0
+    prev_negative = audio_data[0] < 0
+
+    for i in range(n):
+        value = float(audio_data[i])
+        sum_squares += value * value
+        negative = value < 0
+        if negative != prev_negative:
+            crossings += 1
+        prev_negative = negative
+
+    return math.sqrt(sum_squares / n), crossings
+
+
+def _rms_and_zcr_numpy(audio_data: np.ndarray) -> Tuple[float, int]:
+    """NumPy fallback for rms_and_zcr when Numba is not installed"""
+    n = len(audio_data)
+    if n == 0:
+        return 0.0, 0
+
+    sum_squares = np.einsum('i,i->', audio_data, audio_data, dtype=np.float64)
+    negative = np.signbit(audio_data)
+    crossings = int(np.count_nonzero(negative[1:] != negative[:-1]))
+
+    return math.sqrt(sum_squares / n), crossings
+
+
+def _rms_and_peak_loop(audio_data: np.ndarray) -> Tuple[float, float]:
+    """
+    Single pass over the samples computing RMS and peak amplitude
+
+    Args:
+        audio_data: Audio samples (int16 or float)
+
+    Returns:
+        Tuple of (RMS in sample units, largest absolute sample value)
+    """
+    n = len(audio_data)
+    if n == 0:
+        return 0.0, 0.0
+
+    sum_squares = 0.0
+    peak = 0.0
+
+    for i in range(n):
+        value = float(audio_data[i])
+        sum_squares += value * value
+        magnitude = abs(value)
+        if magnitude > peak:
+            peak = magnitude
+
+    return math.sqrt(sum_squares / n), peak
+
+
+def _rms_and_peak_numpy(audio_data: np.ndarray) -> Tuple[float, float]:
+    """NumPy fallback for rms_and_peak when Numba is not installed"""
+    n = len(audio_data)
+    if n == 0:
+        return 0.0, 0.0
+
+    sum_squares = np.einsum('i,i->', audio_data, audio_data, dtype=np.float64)
+    # max/min instead of abs, which would overflow on int16 -32768
+    peak = max(float(audio_data.max()), -float(audio_data.min()))
+
+    return math.sqrt(sum_squares / n), peak
+
+
+if njit is not None:
+    # cache=True keeps the compiled kernel on disk, avoiding the compile on every start
+    rms_and_zcr = njit(cache=True, fastmath=True)(_rms_and_zcr_loop)
+    rms_and_peak = njit(cache=True, fastmath=True)(_rms_and_peak_loop)
+else:
+    rms_and_zcr = _rms_and_zcr_numpy
+    rms_and_peak = _rms_and_peak_numpy
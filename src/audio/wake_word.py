@@ -4,12 +4,34 @@ Wake Word Detection System
 Simple keyword-based wake word detection
 """
 
-import numpy as np
-from typing import List, Optional
 import re
+import numpy as np
 from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from loguru import logger
+from rapidfuzz import fuzz, process, utils
+
+# Optional Aho-Corasick automaton for exact wake word matches
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional Hyperscan (or Vectorscan on Apple Silicon) database, preferred
+# over the automaton for large custom wake word lists
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Slack for rapidfuzz's float32 scores when used as upper bounds
+RATIO_TOLERANCE = 1e-4
+
+# Score on all cores from this many wake words (or tokens); smaller lists
+# are faster on one thread than the pool startup
+PARALLEL_SCORING_MIN = 32
 
 
 class WakeWordDetector:
@@ -18,7 +40,9 @@ class WakeWordDetector:
     def __init__(
         self,
         models: Optional[List[str]] = None,
-        threshold: float = 0.6  # Lower threshold for better detection
+        threshold: float = 0.6,  # Lower threshold for better detection
+        audio_models: Optional[List[str]] = None,
+        audio_threshold: float = 0.5
     ):
         """
         Initialize wake word detector
@@ -26,12 +50,15 @@ class WakeWordDetector:
         Args:
             models: List of wake words/phrases
             threshold: Detection threshold (0.0 to 1.0)
+            audio_models: openWakeWord model names or paths for acoustic detection
+            audio_threshold: Score threshold for acoustic detection (0.0 to 1.0)
         """
         self.threshold = threshold
+        self.audio_threshold = audio_threshold
         
         # Default German wake words if none provided
         if models is None:
-            self.wake_words = [
+            models = [
                 "hey logic",
                 "hallo logic", 
                 "logic",
@@ -42,16 +69,171 @@ class WakeWordDetector:
                 "hallo logik",
                 "hey logik"
             ]
-        else:
-            self.wake_words = models
+        
+        # Insertion-ordered set of wake words; self.wake_words is the list view
+        self._wake_set = dict.fromkeys(models)
+        self.wake_words = list(self._wake_set)
         
         logger.info(f"🎯 Wake word detector initialized")
         logger.info(f"📝 Wake words: {', '.join(self.wake_words)}")
         logger.info(f"🎚️ Threshold: {threshold}")
         
-        # Preprocessing patterns
-        self.cleanup_pattern = re.compile(r'[^\w\s]', re.UNICODE)
+        # Per-instance cache of detection results by normalized text
+        self._match_cache = lru_cache(maxsize=1024)(self._match_normalized)
+        
+        # Normalized wake words and exact matcher, rebuilt when the list changes
+        self._hs_db = None
+        self._automaton = None
+        self._prepare_wake_words()
+        
+        # Acoustic wake word model (gates Whisper so it only runs for commands)
+        self._audio_model = None
+        if audio_models:
+            # Imported only when configured, openwakeword loads its inference runtime
+            try:
+                from openwakeword.model import Model as OpenWakeWordModel
+            except ImportError:
+                OpenWakeWordModel = None
+            
+            if OpenWakeWordModel is None:
+                logger.warning("⚠️ openwakeword not installed, using transcription-based detection")
+            else:
+                # ONNX Runtime works on every platform (tflite-runtime has no macOS
+                # builds) and runs int8 models from quantize_wake_word.py
+                framework = "tflite" if any(m.endswith(".tflite") for m in audio_models) else "onnx"
+                self._audio_model = OpenWakeWordModel(
+                    wakeword_models=audio_models,
+                    inference_framework=framework
+                )
+                logger.info(f"🔊 Acoustic wake word models: {', '.join(audio_models)}")
+        
+    def _prepare_wake_words(self):
+        """Precompute normalized wake words, their tokens and the exact matcher"""
+        self.wake_words = list(self._wake_set)
+        self._normalized_wake_words = [self._normalize_text(w) for w in self.wake_words]
+        
+        # Tokens of multi-word wake words for word-by-word scoring, with the
+        # index of the wake word each token belongs to
+        tokens = []
+        owners = []
+        counts = []
+        for index, normalized_wake_word in enumerate(self._normalized_wake_words):
+            words = normalized_wake_word.split()
+            if len(words) > 1:
+                tokens.extend(words)
+                owners.extend([index] * len(words))
+            counts.append(max(len(words), 1))
+        self._wake_tokens = tokens
+        self._wake_token_owners = np.array(owners, dtype=np.intp)
+        self._wake_token_counts = np.array(counts, dtype=np.float64)
+        
+        # Length bounds for the short text cutoff (see _min_text_length)
+        self._min_wake_word_length = min((len(w) for w in self._normalized_wake_words), default=0)
+        self._min_token_match_length = min((0.7 * len(t) / 1.3 for t in tokens), default=float('inf'))
+        
+        self._build_matcher()
+        self._match_cache.cache_clear()
+    
+    def _build_matcher(self):
+        """Rebuild the exact matcher (Hyperscan or Aho-Corasick) from the normalized wake words"""
+        self._hs_db = None
+        self._automaton = None
+        
+        patterns = [
+            (index, normalized_wake_word)
+            for index, normalized_wake_word in enumerate(self._normalized_wake_words)
+            if normalized_wake_word
+        ]
+        # An empty database or automaton cannot be searched
+        if not patterns:
+            return
+        
+        if hyperscan is not None:
+            try:
+                database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                database.compile(
+                    expressions=[re.escape(w).encode('utf-8') for _, w in patterns],
+                    ids=[index for index, _ in patterns],
+                    elements=len(patterns),
+                    flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(patterns)
+                )
+                self._hs_db = database
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ Hyperscan compile failed, using fallback matcher: {e}")
         
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for index, normalized_wake_word in patterns:
+                automaton.add_word(normalized_wake_word, self.wake_words[index])
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def _find_exact(self, cleaned_text: str) -> Optional[str]:
+        """
+        Find a wake word contained verbatim in normalized text
+        
+        Args:
+            cleaned_text: Normalized text to search in
+            
+        Returns:
+            Matching wake word or None
+        """
+        # All wake words in one pass over the text
+        if self._hs_db is not None:
+            matches = []
+            
+            def on_match(pattern_id, start, end, flags, context):
+                matches.append(pattern_id)
+            
+            self._hs_db.scan(cleaned_text.encode('utf-8'), match_event_handler=on_match)
+            return self.wake_words[min(matches)] if matches else None
+        
+        if self._automaton is not None:
+            match = next(self._automaton.iter(cleaned_text), None)
+            return match[1] if match is not None else None
+        
+        # Without either matcher, check wake words one by one
+        for wake_word, normalized_wake_word in zip(self.wake_words, self._normalized_wake_words):
+            if normalized_wake_word and normalized_wake_word in cleaned_text:
+                return wake_word
+        
+        return None
+    
+    @property
+    def has_audio_model(self) -> bool:
+        """Whether an acoustic wake word model is loaded"""
+        return self._audio_model is not None
+    
+    def detect_in_audio(self, audio_data: np.ndarray, sample_rate: int = 16000) -> bool:
+        """
+        Detect wake word directly in audio with the acoustic model
+        
+        Args:
+            audio_data: Audio data as int16 numpy array (ideally multiples of 80 ms)
+            sample_rate: Sample rate of audio data (openWakeWord requires 16 kHz)
+            
+        Returns:
+            True if wake word detected
+        """
+        if self._audio_model is None or sample_rate != 16000:
+            return False
+        
+        try:
+            scores = self._audio_model.predict(audio_data)
+        except Exception as e:
+            logger.error(f"❌ Wake word detection error: {e}")
+            return False
+        
+        for name, score in scores.items():
+            if score >= self.audio_threshold:
+                logger.info(f"🎯 Wake word detected: '{name}' (score: {score:.2f})")
+                # Drop buffered frames so the same utterance does not fire again
+                self._audio_model.reset()
+                return True
+        
+        return False
+    
     def detect(self, audio_data: np.ndarray, stt_engine=None) -> bool:
         """
         Detect wake word in audio data
@@ -100,22 +282,42 @@ class WakeWordDetector:
         
         logger.debug(f"🔍 Checking text: '{cleaned_text}'")
         
-        # Check each wake word
-        for wake_word in self.wake_words:
-            normalized_wake_word = self._normalize_text(wake_word)
-            
-            # Exact match
-            if normalized_wake_word in cleaned_text:
-                logger.info(f"🎯 Wake word detected: '{wake_word}' (exact match)")
-                return True
+        # Transcripts repeat a lot (silence, fillers), so results are cached
+        match = self._match_cache(cleaned_text, self.threshold)
+        if match is None:
+            return False
+        
+        wake_word, detail = match
+        logger.info(f"🎯 Wake word detected: '{wake_word}' ({detail})")
+        return True
+    
+    def _match_normalized(self, cleaned_text: str, threshold: float) -> Optional[Tuple[str, str]]:
+        """
+        Find the wake word matching normalized text
+        
+        Args:
+            cleaned_text: Normalized text to check
+            threshold: Detection threshold (part of the cache key)
             
-            # Fuzzy match using sequence similarity
-            similarity = self._calculate_similarity(normalized_wake_word, cleaned_text)
-            if similarity >= self.threshold:
-                logger.info(f"🎯 Wake word detected: '{wake_word}' (similarity: {similarity:.2f})")
-                return True
+        Returns:
+            Tuple of (wake word, match detail) or None if no wake word matches
+        """
+        # Too short for any wake word to reach the threshold
+        if len(cleaned_text) < self._min_text_length():
+            return None
         
-        return False
+        # Exact match
+        wake_word = self._find_exact(cleaned_text)
+        if wake_word is not None:
+            return wake_word, "exact match"
+        
+        # Fuzzy match all wake words at once
+        scores = self._calculate_similarities(cleaned_text)
+        best = int(scores.argmax())
+        if scores[best] >= threshold:
+            return self.wake_words[best], f"similarity: {scores[best]:.2f}"
+        
+        return None
     
     def _normalize_text(self, text: str) -> str:
         """
@@ -127,64 +329,92 @@ class WakeWordDetector:
         Returns:
             Normalized text
         """
-        # Convert to lowercase
-        text = text.lower()
+        # Lowercase and replace punctuation with spaces (done in C by rapidfuzz),
+        # then collapse extra whitespace
+        return ' '.join(utils.default_process(text).split())
+    
+    def _min_text_length(self) -> float:
+        """
+        Shortest text length that could reach the threshold for any wake word
         
-        # Remove punctuation and extra whitespace
-        text = self.cleanup_pattern.sub(' ', text)
-        text = ' '.join(text.split())
+        Direct similarity 2 * matches / (wake word + text length) needs a text of
+        at least threshold * length / (2 - threshold) characters, and a wake word
+        token only scores above 0.7 against a word of more than 0.7 * length / 1.3.
         
-        return text
+        Returns:
+            Minimum text length in characters
+        """
+        direct_length = self.threshold * self._min_wake_word_length / (2 - self.threshold)
+        return min(direct_length, self._min_token_match_length)
     
-    def _calculate_similarity(self, wake_word: str, text: str) -> float:
+    def _calculate_similarities(self, text: str) -> np.ndarray:
         """
-        Calculate similarity between wake word and text
+        Calculate similarity between every wake word and text
+        
+        Scores are SequenceMatcher ratios. rapidfuzz's fuzz.ratio (longest common
+        subsequence) is never below them, so it only picks the pairs worth scoring.
         
         Args:
-            wake_word: Wake word to search for
-            text: Text to search in
+            text: Normalized text to search in
             
         Returns:
-            Similarity score (0.0 to 1.0)
+            Similarity scores (0.0 to 1.0), one per wake word. Scores below
+            the threshold may be reported as 0.
         """
-        # Direct similarity
-        direct_similarity = SequenceMatcher(None, wake_word, text).ratio()
+        # Upper bounds of the direct similarity, whole column in one rapidfuzz call
+        bounds = process.cdist(
+            self._normalized_wake_words,
+            [text],
+            scorer=fuzz.ratio,
+            score_cutoff=max(0.0, self.threshold - RATIO_TOLERANCE) * 100,
+            workers=-1 if len(self._normalized_wake_words) >= PARALLEL_SCORING_MIN else 1
+        )[:, 0] / 100.0 + RATIO_TOLERANCE
         
-        # Check if wake word is contained in text
-        if wake_word in text:
-            # Boost score for containment
-            containment_boost = 0.3
-            return min(1.0, direct_similarity + containment_boost)
+        scores = np.zeros(len(self._normalized_wake_words))
+        for index in np.flatnonzero(bounds >= self.threshold):
+            scores[index] = SequenceMatcher(None, self._normalized_wake_words[index], text).ratio()
         
-        # Check word-by-word similarity for multi-word wake words
-        wake_words = wake_word.split()
+        # Word-by-word similarity for multi-word wake words
         text_words = text.split()
-        
-        if len(wake_words) > 1 and len(text_words) > 0:
-            word_matches = 0
-            for w_word in wake_words:
-                best_match = 0
-                for t_word in text_words:
-                    similarity = SequenceMatcher(None, w_word, t_word).ratio()
-                    best_match = max(best_match, similarity)
-                if best_match > 0.7:  # Word similarity threshold
-                    word_matches += 1
+        if self._wake_tokens and text_words:
+            token_bounds = process.cdist(
+                self._wake_tokens,
+                text_words,
+                scorer=fuzz.ratio,
+                score_cutoff=70 - RATIO_TOLERANCE * 100,
+                workers=-1 if len(self._wake_tokens) >= PARALLEL_SCORING_MIN else 1
+            ) / 100.0 + RATIO_TOLERANCE
+            
+            token_matches = np.zeros(len(self._wake_tokens))
+            for token_index, word_index in zip(*np.nonzero(token_bounds > 0.7)):
+                if token_matches[token_index]:
+                    continue
+                token = self._wake_tokens[token_index]
+                # Word similarity threshold
+                if SequenceMatcher(None, token, text_words[word_index]).ratio() > 0.7:
+                    token_matches[token_index] = 1
             
-            word_similarity = word_matches / len(wake_words)
-            return max(direct_similarity, word_similarity)
+            word_matches = np.bincount(
+                self._wake_token_owners,
+                weights=token_matches,
+                minlength=len(scores)
+            )
+            scores = np.maximum(scores, word_matches / self._wake_token_counts)
         
-        return direct_similarity
+        return scores
     
     def add_wake_word(self, wake_word: str):
         """Add a new wake word"""
-        if wake_word not in self.wake_words:
-            self.wake_words.append(wake_word)
+        if wake_word not in self._wake_set:
+            self._wake_set[wake_word] = None
+            self._prepare_wake_words()
             logger.info(f"➕ Added wake word: '{wake_word}'")
     
     def remove_wake_word(self, wake_word: str):
         """Remove a wake word"""
-        if wake_word in self.wake_words:
-            self.wake_words.remove(wake_word)
+        if wake_word in self._wake_set:
+            del self._wake_set[wake_word]
+            self._prepare_wake_words()
             logger.info(f"➖ Removed wake word: '{wake_word}'")
     
     def set_threshold(self, threshold: float):
@@ -194,7 +424,7 @@ class WakeWordDetector:
     
     def get_wake_words(self) -> List[str]:
         """Get list of current wake words"""
-        return self.wake_words.copy()
+        return list(self._wake_set)
 
 
 # Test functions
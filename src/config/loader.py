@@ -7,9 +7,7 @@ Loads and manages application configuration
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
-import yaml
-import json
+from dataclasses import dataclass, field, fields, replace
 
 from loguru import logger
 
@@ -28,6 +26,8 @@ class WakeWordConfig:
     """Wake word detection configuration"""
     models: List[str] = field(default_factory=lambda: ["hey logic", "logic", "computer"])
     threshold: float = 0.8
+    audio_models: List[str] = field(default_factory=list)  # openWakeWord models
+    audio_threshold: float = 0.5
 
 
 @dataclass
@@ -78,6 +78,47 @@ class AppConfig:
     log_level: str = "INFO"
 
 
+# Keys accepted for each config file section
+SECTION_FIELDS = {
+    'audio': frozenset(f.name for f in fields(AudioConfig)),
+    'wake_word': frozenset(f.name for f in fields(WakeWordConfig)),
+    'stt': frozenset(f.name for f in fields(STTConfig)),
+    'feedback': frozenset(f.name for f in fields(FeedbackConfig)),
+    'logic_pro': frozenset(f.name for f in fields(LogicProConfig)),
+}
+COMMANDS_FIELDS = frozenset({'timeout', 'confirmation'})
+GLOBAL_FIELDS = frozenset({'debug', 'dry_run', 'log_level'})
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON with orjson when installed, else the standard library"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(raw)
+    
+    return orjson.loads(raw)
+
+
+def _env_flag(value: str) -> Optional[bool]:
+    """Truthy environment flag, None leaves the setting unchanged"""
+    return True if value.lower() in ('true', '1', 'yes') else None
+
+
+# Environment overrides: (variable, config section or None for global, attribute,
+# converter, debug message)
+ENV_OVERRIDES = [
+    ('AUDIO_DEVICE', 'audio', 'input_device', str, "🔧 Audio device override: {}"),
+    ('STT_LANGUAGE', 'stt', 'language', str, "🌐 Language override: {}"),
+    ('STT_MODEL', 'stt', 'model', str, "🤖 Model override: {}"),
+    ('AUDIO_SAMPLE_RATE', 'audio', 'sample_rate', int, "🎵 Sample rate override: {}"),
+    ('DEBUG_MODE', None, 'debug', _env_flag, "🐛 Debug mode enabled via environment"),
+    ('DRY_RUN', None, 'dry_run', _env_flag, "🧪 Dry run mode enabled via environment"),
+    ('LOG_LEVEL', None, 'log_level', str.upper, "📝 Log level override: {}"),
+]
+
+
 class ConfigLoader:
     """Configuration loader and manager"""
     
@@ -106,11 +147,17 @@ class ConfigLoader:
             logger.info(f"📋 Loading config from: {self.config_path}")
             
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
+                # Binary mode: both parsers decode UTF-8 themselves
+                # Parsers are imported here, only when a config file is read
+                with open(self.config_path, 'rb') as f:
                     if self.config_path.suffix.lower() == '.json':
-                        config_data = json.load(f)
+                        config_data = _load_json(f.read())
                     else:
-                        config_data = yaml.safe_load(f)
+                        import yaml
+                        
+                        # libyaml C loader when PyYAML was built with it
+                        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                        config_data = yaml.load(f, Loader=loader)
                 
                 self._apply_config_data(config_data)
                 logger.success("✅ Configuration file loaded")
@@ -143,101 +190,47 @@ class ConfigLoader:
     def _apply_config_data(self, config_data: Dict[str, Any]):
         """Apply configuration data to config object"""
         
-        # Audio configuration
-        if 'audio' in config_data:
-            audio_data = config_data['audio']
-            self.config.audio.input_device = audio_data.get('input_device', self.config.audio.input_device)
-            self.config.audio.sample_rate = audio_data.get('sample_rate', self.config.audio.sample_rate)
-            self.config.audio.channels = audio_data.get('channels', self.config.audio.channels)
-            self.config.audio.buffer_size = audio_data.get('buffer_size', self.config.audio.buffer_size)
-        
-        # Wake word configuration
-        if 'wake_word' in config_data:
-            wake_data = config_data['wake_word']
-            self.config.wake_word.models = wake_data.get('models', self.config.wake_word.models)
-            self.config.wake_word.threshold = wake_data.get('threshold', self.config.wake_word.threshold)
-        
-        # STT configuration
-        if 'stt' in config_data:
-            stt_data = config_data['stt']
-            self.config.stt.model = stt_data.get('model', self.config.stt.model)
-            self.config.stt.language = stt_data.get('language', self.config.stt.language)
-            self.config.stt.device = stt_data.get('device', self.config.stt.device)
-        
-        # Feedback configuration
-        if 'feedback' in config_data:
-            feedback_data = config_data['feedback']
-            self.config.feedback.voice = feedback_data.get('voice', self.config.feedback.voice)
-            self.config.feedback.rate = feedback_data.get('rate', self.config.feedback.rate)
-            self.config.feedback.enabled = feedback_data.get('enabled', self.config.feedback.enabled)
-        
-        # Logic Pro configuration
-        if 'logic_pro' in config_data:
-            logic_data = config_data['logic_pro']
-            self.config.logic_pro.enabled = logic_data.get('enabled', self.config.logic_pro.enabled)
-            self.config.logic_pro.app_name = logic_data.get('app_name', self.config.logic_pro.app_name)
-            self.config.logic_pro.check_running = logic_data.get('check_running', self.config.logic_pro.check_running)
+        # Sections that map one to one onto their dataclasses
+        for name, names in SECTION_FIELDS.items():
+            if name in config_data:
+                section = getattr(self.config, name)
+                setattr(self.config, name, self._merge(section, config_data[name], names))
         
         # Commands configuration
         if 'commands' in config_data:
             cmd_data = config_data['commands']
-            self.config.commands.timeout = cmd_data.get('timeout', self.config.commands.timeout)
-            self.config.commands.confirmation = cmd_data.get('confirmation', self.config.commands.confirmation)
+            self.config.commands = self._merge(self.config.commands, cmd_data, COMMANDS_FIELDS)
             # Store all command data for parser
             self.config.commands.custom_commands = cmd_data
         
-        # System/Global settings
-        if 'system' in config_data:
-            sys_data = config_data['system']
-            self.config.debug = sys_data.get('debug', self.config.debug)
-            self.config.dry_run = sys_data.get('dry_run', self.config.dry_run)
-            self.config.log_level = sys_data.get('log_level', self.config.log_level)
-        else:
-            # Fallback to root level
-            self.config.debug = config_data.get('debug', self.config.debug)
-            self.config.dry_run = config_data.get('dry_run', self.config.dry_run)
-            self.config.log_level = config_data.get('log_level', self.config.log_level)
+        # System/Global settings (fallback to root level)
+        global_data = config_data.get('system', config_data)
+        self.config = self._merge(self.config, global_data, GLOBAL_FIELDS)
+    
+    @staticmethod
+    def _merge(section, data: Dict[str, Any], names: frozenset):
+        """Copy of a config dataclass with the known keys of data applied"""
+        return replace(section, **{key: value for key, value in data.items() if key in names})
     
     def _load_env_overrides(self):
         """Load environment variable overrides"""
-        
-        # Audio device override
-        if os.getenv('AUDIO_DEVICE'):
-            self.config.audio.input_device = os.getenv('AUDIO_DEVICE')
-            logger.debug(f"🔧 Audio device override: {self.config.audio.input_device}")
-        
-        # STT language override
-        if os.getenv('STT_LANGUAGE'):
-            self.config.stt.language = os.getenv('STT_LANGUAGE')
-            logger.debug(f"🌐 Language override: {self.config.stt.language}")
-        
-        # STT model override
-        if os.getenv('STT_MODEL'):
-            self.config.stt.model = os.getenv('STT_MODEL')
-            logger.debug(f"🤖 Model override: {self.config.stt.model}")
-        
-        # Sample rate override
-        if os.getenv('AUDIO_SAMPLE_RATE'):
+        for name, section_name, attribute, convert, message in ENV_OVERRIDES:
+            raw_value = os.environ.get(name)
+            if not raw_value:
+                continue
+            
             try:
-                self.config.audio.sample_rate = int(os.getenv('AUDIO_SAMPLE_RATE'))
-                logger.debug(f"🎵 Sample rate override: {self.config.audio.sample_rate}")
+                value = convert(raw_value)
             except ValueError:
-                logger.warning(f"⚠️ Invalid sample rate in AUDIO_SAMPLE_RATE: {os.getenv('AUDIO_SAMPLE_RATE')}")
-        
-        # Debug mode override
-        if os.getenv('DEBUG_MODE', '').lower() in ('true', '1', 'yes'):
-            self.config.debug = True
-            logger.debug("🐛 Debug mode enabled via environment")
-        
-        # Dry run override
-        if os.getenv('DRY_RUN', '').lower() in ('true', '1', 'yes'):
-            self.config.dry_run = True
-            logger.debug("🧪 Dry run mode enabled via environment")
-        
-        # Log level override
-        if os.getenv('LOG_LEVEL'):
-            self.config.log_level = os.getenv('LOG_LEVEL').upper()
-            logger.debug(f"📝 Log level override: {self.config.log_level}")
+                logger.warning(f"⚠️ Invalid value in {name}: {raw_value}")
+                continue
+            
+            if value is None:
+                continue
+            
+            section = getattr(self.config, section_name) if section_name else self.config
+            setattr(section, attribute, value)
+            logger.debug(message.format(value))
     
     def save_config(self, path: Optional[Path] = None):
         """Save current configuration to file"""
@@ -253,6 +246,8 @@ class ConfigLoader:
             'wake_word': {
                 'models': self.config.wake_word.models,
                 'threshold': self.config.wake_word.threshold,
+                'audio_models': self.config.wake_word.audio_models,
+                'audio_threshold': self.config.wake_word.audio_threshold,
             },
             'stt': {
                 'model': self.config.stt.model,
@@ -280,6 +275,8 @@ class ConfigLoader:
         }
         
         try:
+            import yaml
+            
             with open(save_path, 'w', encoding='utf-8') as f:
                 yaml.dump(config_dict, f, default_flow_style=False, allow_unicode=True)
             
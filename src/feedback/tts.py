@@ -6,6 +6,7 @@ Uses macOS 'say' command for voice output
 
 import asyncio
 import subprocess
+from functools import lru_cache
 from typing import Optional
 import platform
 from loguru import logger
@@ -42,11 +43,78 @@ class TTSFeedback:
             logger.warning("⚠️ TTS only supported on macOS, disabling")
             self.enabled = False
         
+        # Warm 'say' process waiting on stdin for the next utterance
+        self._standby = None
+        self._standby_key = None
+        
         if self.enabled:
+            self._spawn_standby()
             logger.info(f"🔊 TTS initialized (voice: {voice}, rate: {rate})")
         else:
             logger.info("🔇 TTS disabled")
     
+    def _build_command(self) -> list:
+        """Build say command for the current voice and rate"""
+        cmd = ["say"]
+        
+        # Add voice if specified
+        if self.voice:
+            cmd.extend(["-v", self.voice])
+        
+        # Add rate if specified
+        if self.rate:
+            cmd.extend(["-r", str(self.rate)])
+        
+        return cmd
+    
+    def _spawn_standby(self):
+        """
+        Start the next 'say' process ahead of time
+        
+        say only starts speaking once stdin is closed, so the process launch
+        happens while idle instead of in front of the next utterance.
+        """
+        try:
+            self._standby = subprocess.Popen(
+                self._build_command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            self._standby_key = (self.voice, self.rate)
+        except Exception as e:
+            logger.error(f"❌ Failed to start say: {e}")
+            self._standby = None
+    
+    def _take_process(self) -> subprocess.Popen:
+        """Hand out the warm 'say' process, starting one if needed"""
+        proc = self._standby
+        self._standby = None
+        
+        # Voice or rate changed, or the process died
+        if proc is not None and (proc.poll() is not None or self._standby_key != (self.voice, self.rate)):
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc = None
+        
+        if proc is None:
+            self._spawn_standby()
+            proc = self._standby
+            self._standby = None
+            if proc is None:
+                raise RuntimeError("say process could not be started")
+        
+        return proc
+    
+    def close(self):
+        """Stop the waiting 'say' process"""
+        if self._standby is not None:
+            if self._standby.poll() is None:
+                self._standby.kill()
+                self._standby.wait()
+            self._standby = None
+    
     def speak(self, text: str) -> bool:
         """
         Speak text using macOS say command
@@ -61,38 +129,26 @@ class TTSFeedback:
             return False
         
         try:
-            # Build say command
-            cmd = ["say"]
-            
-            # Add voice if specified
-            if self.voice:
-                cmd.extend(["-v", self.voice])
+            proc = self._take_process()
             
-            # Add rate if specified
-            if self.rate:
-                cmd.extend(["-r", str(self.rate)])
-            
-            # Add text
-            cmd.append(text)
-            
-            # Execute command
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # Closing stdin starts the speech
+            try:
+                _, stderr = proc.communicate(input=text.encode("utf-8"), timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                logger.warning("⚠️ TTS timeout")
+                return False
+            finally:
+                self._spawn_standby()
             
-            if result.returncode == 0:
+            if proc.returncode == 0:
                 logger.debug(f"🔊 Spoke: '{text}'")
                 return True
             else:
-                logger.warning(f"⚠️ Say command failed: {result.stderr}")
+                logger.warning(f"⚠️ Say command failed: {stderr.decode(errors='replace')}")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            logger.warning("⚠️ TTS timeout")
-            return False
         except Exception as e:
             logger.error(f"❌ TTS error: {e}")
             return False
@@ -110,44 +166,8 @@ class TTSFeedback:
         if not self.enabled or not text:
             return False
         
-        try:
-            # Build say command
-            cmd = ["say"]
-            
-            if self.voice:
-                cmd.extend(["-v", self.voice])
-            
-            if self.rate:
-                cmd.extend(["-r", str(self.rate)])
-            
-            cmd.append(text)
-            
-            # Execute asynchronously
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            # Wait for completion with timeout
-            try:
-                await asyncio.wait_for(process.wait(), timeout=10)
-                
-                if process.returncode == 0:
-                    logger.debug(f"🔊 Spoke async: '{text}'")
-                    return True
-                else:
-                    logger.warning("⚠️ Say command failed")
-                    return False
-                    
-            except asyncio.TimeoutError:
-                process.kill()
-                logger.warning("⚠️ TTS timeout")
-                return False
-                
-        except Exception as e:
-            logger.error(f"❌ TTS async error: {e}")
-            return False
+        # Runs the warm say process from speak() without blocking the loop
+        return await asyncio.to_thread(self.speak, text)
     
     def list_voices(self) -> list:
         """List available macOS voices"""
@@ -155,26 +175,8 @@ class TTSFeedback:
             return []
         
         try:
-            result = subprocess.run(
-                ["say", "-v", "?"],
-                capture_output=True,
-                text=True
-            )
-            
-            voices = []
-            for line in result.stdout.splitlines():
-                if line:
-                    # Parse voice info
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        voice_name = parts[0]
-                        language = parts[1] if len(parts) > 1 else ""
-                        voices.append({
-                            "name": voice_name,
-                            "language": language
-                        })
-            
-            return voices
+            # Copies, so callers cannot modify the cached table
+            return [dict(voice) for voice in _read_voices()]
             
         except Exception as e:
             logger.error(f"❌ Failed to list voices: {e}")
@@ -189,6 +191,36 @@ class TTSFeedback:
         return self.speak(text)
 
 
+@lru_cache(maxsize=1)
+def _read_voices() -> tuple:
+    """
+    Parse the 'say -v ?' voice table once per process
+    
+    Installed voices do not change while running. Errors are raised and
+    therefore not cached.
+    """
+    result = subprocess.run(
+        ["say", "-v", "?"],
+        capture_output=True,
+        text=True
+    )
+    
+    voices = []
+    for line in result.stdout.splitlines():
+        if line:
+            # Parse voice info
+            parts = line.split()
+            if len(parts) >= 2:
+                voice_name = parts[0]
+                language = parts[1] if len(parts) > 1 else ""
+                voices.append({
+                    "name": voice_name,
+                    "language": language
+                })
+    
+    return tuple(voices)
+
+
 # Test functions
 if __name__ == "__main__":
     # Test TTS
@@ -4,14 +4,23 @@ Intent Parser Module
 Parses transcribed text to identify commands and extract parameters
 """
 
-import re
+from difflib import SequenceMatcher
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
-from difflib import SequenceMatcher
 from loguru import logger
+from rapidfuzz import fuzz, process, utils
+
+# Optional Aho-Corasick automaton for pattern containment
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
+# Slack for rapidfuzz's float32 scores when used as upper bounds
+RATIO_TOLERANCE = 1e-4
 
-@dataclass
+
+@dataclass(slots=True)
 class Intent:
     """Represents a recognized intent"""
     name: str
@@ -40,6 +49,18 @@ class IntentParser:
         else:
             self._load_default_commands()
         
+        # Flat list of normalized patterns over all commands, computed once
+        # instead of per parse and scored in one batch
+        self._patterns = []
+        self._normalized_patterns = []
+        self._word_index = {}
+        for command in self.commands:
+            self._compile_command(command)
+        
+        # Containment of all patterns in one pass over the text
+        self._automaton = None
+        self._build_matcher()
+        
         logger.info(f"📝 Intent parser initialized with {len(self.commands)} commands")
     
     def _load_commands(self, config: Dict[str, Any]):
@@ -85,6 +106,65 @@ class IntentParser:
             }
         ]
     
+    def _compile_command(self, command: Dict[str, Any]):
+        """
+        Precompute normalized patterns of a command
+        
+        Args:
+            command: Command dictionary
+        """
+        for pattern in command.get('patterns', []):
+            normalized_pattern = self._normalize_text(pattern)
+            self._patterns.append(
+                (command, pattern, normalized_pattern, frozenset(normalized_pattern.split()))
+            )
+            self._normalized_patterns.append(normalized_pattern)
+            
+            # Word -> indices of the patterns containing it
+            for word in set(normalized_pattern.split()):
+                self._word_index.setdefault(word, []).append(len(self._patterns) - 1)
+    
+    def _build_matcher(self):
+        """Rebuild the Aho-Corasick automaton from the normalized patterns"""
+        if ahocorasick is None:
+            return
+        
+        # The same pattern can belong to several commands
+        indices = {}
+        for index, normalized_pattern in enumerate(self._normalized_patterns):
+            if normalized_pattern:
+                indices.setdefault(normalized_pattern, []).append(index)
+        
+        # An automaton without keys cannot be searched
+        if not indices:
+            self._automaton = None
+            return
+        
+        automaton = ahocorasick.Automaton()
+        for normalized_pattern, pattern_indices in indices.items():
+            automaton.add_word(normalized_pattern, pattern_indices)
+        automaton.make_automaton()
+        self._automaton = automaton
+    
+    def _contained_patterns(self, normalized_text: str) -> set:
+        """Indices of all patterns contained in the normalized text"""
+        if self._automaton is not None:
+            contained = set()
+            for _, pattern_indices in self._automaton.iter(normalized_text):
+                contained.update(pattern_indices)
+        else:
+            contained = {
+                index for index, normalized_pattern in enumerate(self._normalized_patterns)
+                if normalized_pattern and normalized_pattern in normalized_text
+            }
+        
+        # An empty pattern is contained in every text
+        contained.update(
+            index for index, normalized_pattern in enumerate(self._normalized_patterns)
+            if not normalized_pattern
+        )
+        return contained
+    
     def parse(self, text: str) -> Optional[Intent]:
         """
         Parse text to identify intent
@@ -104,29 +184,56 @@ class IntentParser:
         
         best_match = None
         best_confidence = 0
+        text_words = frozenset(normalized_text.split())
         
-        # Check each command
-        for command in self.commands:
-            # Check patterns
-            for pattern in command.get('patterns', []):
-                normalized_pattern = self._normalize_text(pattern)
-                
-                # Calculate similarity
-                confidence = self._calculate_similarity(
-                    normalized_pattern,
-                    normalized_text
-                )
+        # fuzz.ratio (LCS based) is an upper bound of SequenceMatcher's ratio,
+        # one batch call tells which patterns can reach min_confidence at all
+        bounds = [
+            score / 100.0 + RATIO_TOLERANCE
+            for score in process.cdist(self._normalized_patterns, [normalized_text], scorer=fuzz.ratio)[:, 0].tolist()
+        ]
+        
+        # Other patterns share no word with the text and are not contained in
+        # it, so their confidence is their direct similarity, below the bound
+        contained = self._contained_patterns(normalized_text)
+        candidates = set(contained)
+        for word in text_words:
+            candidates.update(self._word_index.get(word, ()))
+        candidates.update(index for index, bound in enumerate(bounds) if bound >= self.min_confidence)
+        
+        # In pattern order, the first pattern wins ties
+        for index in sorted(candidates):
+            command, pattern, normalized_pattern, pattern_words = self._patterns[index]
+            
+            # Word similarity first, it is cheap
+            confidence = self._calculate_similarity(
+                normalized_pattern,
+                normalized_text,
+                pattern_words,
+                text_words,
+                direct_sim=0.0
+            )
+            
+            # Check for exact containment
+            if index in contained:
+                confidence = max(confidence, 0.9)
+            
+            # Direct similarity only where it can still decide the match
+            bound = bounds[index]
+            if bound >= self.min_confidence and bound > confidence and bound > best_confidence:
+                confidence = max(confidence, SequenceMatcher(None, normalized_pattern, normalized_text).ratio())
+            
+            # Update best match
+            if confidence > best_confidence:
+                best_confidence = confidence
+                best_match = command
                 
-                # Check for exact containment
-                if normalized_pattern in normalized_text:
-                    confidence = max(confidence, 0.9)
+                logger.debug(f"  Pattern '{pattern}' -> confidence: {confidence:.2f}")
                 
-                # Update best match
-                if confidence > best_confidence:
-                    best_confidence = confidence
-                    best_match = command
-                    
-                    logger.debug(f"  Pattern '{pattern}' -> confidence: {confidence:.2f}")
+                # Later patterns only win with a strictly higher confidence,
+                # so nothing can beat a perfect match
+                if best_confidence >= 1.0:
+                    break
         
         # Return intent if confidence is high enough
         if best_match and best_confidence >= self.min_confidence:
@@ -147,25 +254,28 @@ class IntentParser:
     
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison"""
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove punctuation
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        # Lowercase and replace punctuation with spaces (done in C by rapidfuzz),
+        # then collapse extra whitespace
+        return ' '.join(utils.default_process(text).split())
     
-    def _calculate_similarity(self, pattern: str, text: str) -> float:
-        """Calculate similarity between pattern and text"""
+    def _calculate_similarity(
+        self,
+        pattern: str,
+        text: str,
+        pattern_words: Optional[frozenset] = None,
+        text_words: Optional[frozenset] = None,
+        direct_sim: Optional[float] = None
+    ) -> float:
+        """Calculate similarity between pattern and text (computes what is not given)"""
         # Direct similarity
-        direct_sim = SequenceMatcher(None, pattern, text).ratio()
+        if direct_sim is None:
+            direct_sim = SequenceMatcher(None, pattern, text).ratio()
         
         # Word-based similarity
-        pattern_words = set(pattern.split())
-        text_words = set(text.split())
+        if pattern_words is None:
+            pattern_words = frozenset(pattern.split())
+        if text_words is None:
+            text_words = frozenset(text.split())
         
         if pattern_words and text_words:
             # Calculate Jaccard similarity
@@ -184,12 +294,15 @@ class IntentParser:
     
     def add_command(self, intent: str, patterns: List[str], action: Any = None, feedback: str = ""):
         """Add a new command"""
-        self.commands.append({
+        command = {
             'intent': intent,
             'patterns': patterns,
             'action': action,
             'feedback': feedback
-        })
+        }
+        self.commands.append(command)
+        self._compile_command(command)
+        self._build_matcher()
         logger.info(f"➕ Added command: {intent}")
     
     def set_min_confidence(self, confidence: float):
@@ -6,13 +6,22 @@ Executes recognized commands and returns results
 
 import asyncio
 import subprocess
+import time
+from collections import deque
 from typing import Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from loguru import logger
 
+# Number of executed commands kept in the history
+HISTORY_SIZE = 1024
 
-@dataclass
+# Complex action types that are executed in a worker thread
+BLOCKING_ACTION_TYPES = frozenset({'key_command', 'applescript'})
+
+
+@dataclass(slots=True)
 class CommandResult:
     """Result of command execution"""
     success: bool
@@ -32,7 +41,9 @@ class CommandDispatcher:
             dry_run: If True, only log commands without executing
         """
         self.dry_run = dry_run
-        self.command_history = []
+        
+        # Bounded (timestamp, intent name, text) entries for long sessions
+        self.command_history = deque(maxlen=HISTORY_SIZE)
         
         logger.info(f"🎮 Command dispatcher initialized (dry_run: {dry_run})")
     
@@ -54,11 +65,7 @@ class CommandDispatcher:
             )
         
         # Log command
-        self.command_history.append({
-            'time': datetime.now(),
-            'intent': intent.name,
-            'text': intent.text
-        })
+        self.command_history.append((time.time(), intent.name, intent.text))
         
         logger.info(f"🚀 Executing: {intent.name}")
         
@@ -77,9 +84,21 @@ class CommandDispatcher:
     
     async def execute_async(self, intent) -> CommandResult:
         """Async version of execute"""
+        # Only key commands and AppleScript block, everything else runs inline
+        if not self._is_blocking(intent):
+            return self.execute(intent)
+        
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.execute, intent)
     
+    def _is_blocking(self, intent) -> bool:
+        """Check if executing the intent blocks (pyautogui or osascript)"""
+        if self.dry_run or not intent:
+            return False
+        
+        action = intent.action
+        return isinstance(action, dict) and action.get('type') in BLOCKING_ACTION_TYPES
+    
     def _execute_simple_action(self, action: str, intent) -> CommandResult:
         """Execute simple string action"""
         
@@ -176,15 +195,13 @@ class CommandDispatcher:
         try:
             import pyautogui
             
-            # Parse key combination
-            keys = keys.replace("Cmd", "command")
-            keys = keys.replace("Shift", "shift")
-            keys = keys.replace("Space", "space")
+            # Parse key combination (cached per combination)
+            hotkey = _parse_keys(keys)
             
             # Send keys
-            pyautogui.hotkey(*keys.split("+"))
+            pyautogui.hotkey(*hotkey)
             
-            logger.success(f"✅ Sent keys: {keys}")
+            logger.success(f"✅ Sent keys: {'+'.join(hotkey)}")
             return CommandResult(
                 success=True,
                 feedback=intent.feedback or "Tastenkombination gesendet"
@@ -244,7 +261,14 @@ class CommandDispatcher:
     
     def get_history(self) -> list:
         """Get command history"""
-        return self.command_history.copy()
+        return [
+            {
+                'time': datetime.fromtimestamp(timestamp),
+                'intent': name,
+                'text': text
+            }
+            for timestamp, name, text in self.command_history
+        ]
     
     def clear_history(self):
         """Clear command history"""
@@ -252,6 +276,20 @@ class CommandDispatcher:
         logger.info("📜 Command history cleared")
 
 
+@lru_cache(maxsize=256)
+def _parse_keys(keys: str) -> tuple:
+    """
+    Convert a key combination like 'Cmd+Shift+S' into pyautogui.hotkey arguments
+    
+    Key commands come from the static commands config, so each combination
+    is only parsed once.
+    """
+    keys = keys.replace("Cmd", "command")
+    keys = keys.replace("Shift", "shift")
+    keys = keys.replace("Space", "space")
+    return tuple(keys.split("+"))
+
+
 # Test functions
 if __name__ == "__main__":
     logger.info("🧪 Testing Command Dispatcher...")
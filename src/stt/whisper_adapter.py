@@ -4,10 +4,14 @@ Whisper Speech-to-Text Adapter
 Provides speech recognition using OpenAI's Whisper model
 """
 
-# Force CPU usage to avoid MPS backend issues
+# Run operators that MPS does not implement on the CPU
 import os
 os.environ['PYTORCH_ENABLE_MPS_FALLBACK'] = '1'
 
+# Leave two cores for the audio callback and event loop. Applied where the
+# model is loaded (torch.set_num_threads, CTranslate2 cpu_threads).
+INFERENCE_THREADS = max(1, (os.cpu_count() or 1) - 2)
+
 # Disable tqdm progress bars
 import sys
 from contextlib import contextmanager
@@ -26,9 +30,10 @@ def suppress_stdout():
             sys.stderr = old_stderr
 
 import asyncio
+from functools import lru_cache
 import numpy as np
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 import tempfile
 import wave
 
@@ -36,8 +41,58 @@ import whisper
 import torch
 from loguru import logger
 
-# Disable MPS backend to prevent sparse tensor issues
-torch.backends.mps.is_available = lambda: False
+# Optional CTranslate2 backend (int8 inference, much faster on CPU)
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+
+@lru_cache(maxsize=4)
+def _load_whisper(model_size: str, device: str):
+    """
+    Load an openai-whisper model onto a device, once per process
+    
+    Whisper keeps its alignment heads in a sparse buffer, which cannot be
+    moved to MPS. For MPS the model is loaded on the CPU, the buffer made
+    dense and the model moved afterwards.
+    
+    Args:
+        model_size: Whisper model size
+        device: Device to run on (cpu, cuda, mps)
+        
+    Returns:
+        Loaded Whisper model
+    """
+    if device != "mps":
+        return whisper.load_model(model_size, device=device)
+    
+    model = whisper.load_model(model_size, device="cpu")
+    if model.alignment_heads.is_sparse:
+        model.register_buffer("alignment_heads", model.alignment_heads.to_dense(), persistent=False)
+    return model.to(device)
+
+
+@lru_cache(maxsize=4)
+def _load_faster_whisper(model_size: str, device: str, compute_type: str):
+    """
+    Load a faster-whisper model, once per process
+    
+    Args:
+        model_size: Whisper model size
+        device: CTranslate2 device (cpu, cuda)
+        compute_type: CTranslate2 compute type
+        
+    Returns:
+        Loaded WhisperModel
+    """
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=INFERENCE_THREADS,
+        num_workers=1
+    )
 
 
 class WhisperSTT:
@@ -47,7 +102,9 @@ class WhisperSTT:
         self,
         model_size: str = "small",
         language: str = "de",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        silence_threshold: float = 0.0
     ):
         """
         Initialize Whisper STT
@@ -56,37 +113,69 @@ class WhisperSTT:
             model_size: Whisper model size (tiny, base, small, medium, large)
             language: Language code for transcription (de, en, etc.)
             device: Device to run on (cpu, cuda, mps). Auto-detected if None
+            compute_type: faster-whisper compute type (int8, int8_float16, ...).
+                Defaults to int8 on CPU and int8_float16 on CUDA
+            silence_threshold: RMS (relative to full scale) below which numpy
+                audio is treated as silence and not transcribed. 0 (default) disables
         """
         self.model_size = model_size
         self.language = language
+        self.silence_threshold = silence_threshold
+        self.backend = "faster-whisper" if WhisperModel is not None else "whisper"
         
-        # Auto-detect device if not specified (force CPU to avoid MPS issues)
+        # Auto-detect device if not specified (faster-whisper has no MPS support)
         if device is None:
             if torch.cuda.is_available():
                 self.device = "cuda"
+            elif self.backend == "whisper" and torch.backends.mps.is_available():
+                self.device = "mps"
             else:
-                # Force CPU usage to avoid MPS backend compatibility issues
                 self.device = "cpu"
-                logger.info("🔧 Using CPU backend to avoid MPS compatibility issues")
         else:
             self.device = device
             
-        logger.info(f"🤖 Initializing Whisper STT (model: {model_size}, device: {self.device})")
+        if compute_type is None:
+            compute_type = "int8_float16" if self.device == "cuda" else "int8"
+        self.compute_type = compute_type
+            
+        logger.info(
+            f"🤖 Initializing Whisper STT (model: {model_size}, device: {self.device}, "
+            f"backend: {self.backend})"
+        )
         
         # Load model
         try:
-            # Suppress output during model loading
-            with suppress_stdout():
-                self.model = whisper.load_model(model_size, device=self.device)
+            if self.backend == "faster-whisper":
+                # CTranslate2 only knows cpu/cuda
+                ct2_device = "cuda" if self.device == "cuda" else "cpu"
+                self.model = _load_faster_whisper(model_size, ct2_device, compute_type)
+            else:
+                if self.device == "cpu":
+                    self._limit_torch_threads()
+                
+                # Suppress output during model loading
+                with suppress_stdout():
+                    self.model = _load_whisper(model_size, self.device)
             logger.success(f"✅ Whisper model '{model_size}' loaded successfully")
         except Exception as e:
             logger.error(f"❌ Failed to load Whisper model: {e}")
             raise
     
+    @staticmethod
+    def _limit_torch_threads():
+        """Keep PyTorch CPU inference from competing with the audio threads"""
+        torch.set_num_threads(INFERENCE_THREADS)
+        try:
+            # Only allowed before the first parallel torch operation
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass
+    
     def transcribe(
         self,
         audio_data: Union[np.ndarray, str, Path],
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        initial_prompt: Optional[str] = None
     ) -> str:
         """
         Transcribe audio to text
@@ -94,6 +183,7 @@ class WhisperSTT:
         Args:
             audio_data: Audio data as numpy array, file path, or audio file path
             sample_rate: Sample rate of audio data (if numpy array)
+            initial_prompt: Text to bias decoding towards (e.g. wake words)
             
         Returns:
             Transcribed text
@@ -104,42 +194,52 @@ class WhisperSTT:
                 logger.debug("⚠️ No audio data provided")
                 return ""
             
-            # Handle different input types
-            if isinstance(audio_data, (str, Path)):
-                # File path provided
-                audio_path = str(audio_data)
-            else:
-                # Numpy array provided - check if empty
-                if len(audio_data) == 0:
-                    logger.debug("⚠️ Empty audio data")
-                    return ""
-                
-                # Save to temporary file
-                audio_path = self._save_audio_temp(audio_data, sample_rate)
+            # Skip the model entirely for silent buffers
+            if not isinstance(audio_data, (str, Path)) and not self._has_speech(audio_data):
+                logger.info("🔇 Audio below silence threshold, skipping transcription")
+                return ""
+            
+            if self.backend == "faster-whisper":
+                return self._transcribe_faster_whisper(audio_data, sample_rate, initial_prompt)
+            
+            # Check for empty numpy input
+            if not isinstance(audio_data, (str, Path)) and len(audio_data) == 0:
+                logger.debug("⚠️ Empty audio data")
+                return ""
+            
+            audio, temp_path = self._prepare_audio(audio_data, sample_rate)
+            
+            # Short in-memory audio fits into one 30 s window
+            if isinstance(audio, np.ndarray) and len(audio) <= whisper.audio.N_SAMPLES:
+                text = self._decode_window(audio, initial_prompt)
+                logger.debug(f"🎯 Transcribed: '{text}'")
+                return text
             
             # Transcribe with Whisper (suppress progress output)
-            with suppress_stdout():
-                result = self.model.transcribe(
-                    audio_path,
-                    language=self.language,
-                    task="transcribe",
-                    fp16=False,  # Use FP32 for better compatibility
-                    verbose=False,  # Disable progress output
-                    no_speech_threshold=0.6,  # Higher threshold
-                    logprob_threshold=-1.0,   # More strict
-                    temperature=0.0,          # Most focused (no randomness)
-                    compression_ratio_threshold=2.4,
-                    condition_on_previous_text=False,  # Avoid repetitive text
-                    suppress_blank=True,  # Suppress blank outputs
-                    suppress_tokens="-1"  # Suppress common hallucination tokens
-                )
+            try:
+                with suppress_stdout(), torch.inference_mode():
+                    result = self.model.transcribe(
+                        audio,
+                        language=self.language,
+                        task="transcribe",
+                        fp16=self.device == "cuda",  # FP32 on CPU, half precision on GPU
+                        verbose=False,  # Disable progress output
+                        no_speech_threshold=0.6,  # Higher threshold
+                        logprob_threshold=-1.0,   # More strict
+                        temperature=0.0,          # Most focused (no randomness)
+                        compression_ratio_threshold=2.4,
+                        condition_on_previous_text=False,  # Avoid repetitive text
+                        initial_prompt=initial_prompt,
+                        suppress_blank=True,  # Suppress blank outputs
+                        suppress_tokens="-1"  # Suppress common hallucination tokens
+                    )
+            finally:
+                # Clean up temporary file if we created one
+                if temp_path is not None:
+                    Path(temp_path).unlink(missing_ok=True)
             
             text = result["text"].strip()
             
-            # Clean up temporary file if we created one
-            if not isinstance(audio_data, (str, Path)):
-                Path(audio_path).unlink(missing_ok=True)
-            
             logger.debug(f"🎯 Transcribed: '{text}'")
             return text
             
@@ -147,10 +247,96 @@ class WhisperSTT:
             logger.error(f"❌ Transcription failed: {e}")
             return ""
     
+    def _decode_window(self, audio: np.ndarray, initial_prompt: Optional[str] = None) -> str:
+        """
+        Decode a single 30 s window with openai-whisper
+        
+        Skips transcribe()'s sliding window loop and progress handling,
+        which only matter for long recordings.
+        
+        Args:
+            audio: 16 kHz float32 audio, at most 30 s
+            initial_prompt: Text to bias decoding towards
+            
+        Returns:
+            Transcribed text
+        """
+        options = whisper.DecodingOptions(
+            task="transcribe",
+            language=self.language,
+            temperature=0.0,
+            prompt=initial_prompt,
+            suppress_blank=True,
+            suppress_tokens="-1",
+            without_timestamps=True,
+            fp16=self.device == "cuda"
+        )
+        
+        with torch.inference_mode():
+            mel = whisper.log_mel_spectrogram(
+                whisper.pad_or_trim(audio),
+                n_mels=self.model.dims.n_mels,
+                device=self.model.device
+            )
+            result = whisper.decode(self.model, mel, options)
+        
+        # Same silence rule as transcribe() with no_speech_threshold=0.6, logprob_threshold=-1.0
+        if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+            return ""
+        
+        return result.text.strip()
+    
+    def _transcribe_faster_whisper(
+        self,
+        audio_data: Union[np.ndarray, str, Path],
+        sample_rate: int,
+        initial_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Transcribe with the CTranslate2 backend
+        
+        Args:
+            audio_data: Audio data as numpy array or file path
+            sample_rate: Sample rate of audio data (if numpy array)
+            initial_prompt: Text to bias decoding towards
+            
+        Returns:
+            Transcribed text
+        """
+        if not isinstance(audio_data, (str, Path)) and len(audio_data) == 0:
+            logger.debug("⚠️ Empty audio data")
+            return ""
+        
+        audio, temp_path = self._prepare_audio(audio_data, sample_rate)
+        
+        try:
+            segments, _ = self.model.transcribe(
+                audio,
+                language=self.language,
+                task="transcribe",
+                beam_size=1,
+                temperature=0.0,
+                no_speech_threshold=0.6,
+                log_prob_threshold=-1.0,
+                compression_ratio_threshold=2.4,
+                condition_on_previous_text=False,
+                initial_prompt=initial_prompt,
+                vad_filter=False
+            )
+            # Segments are generated lazily, decoding happens here
+            text = "".join(segment.text for segment in segments).strip()
+        finally:
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
+        
+        logger.debug(f"🎯 Transcribed: '{text}'")
+        return text
+    
     async def transcribe_async(
         self,
         audio_data: Union[np.ndarray, str, Path],
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        initial_prompt: Optional[str] = None
     ) -> str:
         """
         Async version of transcribe
@@ -158,6 +344,7 @@ class WhisperSTT:
         Args:
             audio_data: Audio data as numpy array, file path, or audio file path
             sample_rate: Sample rate of audio data (if numpy array)
+            initial_prompt: Text to bias decoding towards (e.g. wake words)
             
         Returns:
             Transcribed text
@@ -167,9 +354,65 @@ class WhisperSTT:
             None, 
             self.transcribe, 
             audio_data, 
-            sample_rate
+            sample_rate,
+            initial_prompt
         )
     
+    def _has_speech(self, audio_data: np.ndarray) -> bool:
+        """
+        Check if numpy audio is loud enough to contain speech
+        
+        Args:
+            audio_data: Audio samples (int16 or float in [-1, 1])
+            
+        Returns:
+            True if the RMS reaches the silence threshold
+        """
+        if self.silence_threshold <= 0:
+            return True
+        if len(audio_data) == 0:
+            return False
+        
+        rms = float(np.sqrt(np.mean(np.square(audio_data, dtype=np.float32))))
+        if audio_data.dtype == np.int16:
+            rms /= 32768.0
+        
+        return rms >= self.silence_threshold
+    
+    def _prepare_audio(
+        self,
+        audio_data: Union[np.ndarray, str, Path],
+        sample_rate: int
+    ) -> Tuple[Union[np.ndarray, str], Optional[str]]:
+        """
+        Convert input into what the model accepts
+        
+        16 kHz arrays are passed to the model as float32 in memory. Both
+        backends only resample when decoding files, so other sample rates
+        still go through a temporary WAV file.
+        
+        Args:
+            audio_data: Audio data as numpy array or file path
+            sample_rate: Sample rate of audio data (if numpy array)
+            
+        Returns:
+            Tuple of (model input, temporary file to delete or None)
+        """
+        if isinstance(audio_data, (str, Path)):
+            return str(audio_data), None
+        
+        if sample_rate != 16000:
+            # Let the model decode and resample from a file
+            temp_path = self._save_audio_temp(audio_data, sample_rate)
+            return temp_path, temp_path
+        
+        if audio_data.dtype == np.int16:
+            # Scale in one pass straight into a new float32 array
+            return np.multiply(audio_data, np.float32(1.0 / 32768.0), dtype=np.float32), None
+        
+        # Contiguous float32 goes to the log-mel frontend without another copy
+        return np.ascontiguousarray(audio_data, dtype=np.float32), None
+    
     def _save_audio_temp(self, audio_data: np.ndarray, sample_rate: int) -> str:
         """
         Save audio data to temporary WAV file
@@ -193,8 +436,10 @@ class WhisperSTT:
         if audio_data.dtype != np.int16:
             # Normalize and convert to 16-bit
             if audio_data.dtype == np.float32 or audio_data.dtype == np.float64:
-                # Assume float audio is in range [-1, 1]
-                audio_data = (audio_data * 32767).astype(np.int16)
+                # Assume float audio is in range [-1, 1], clip so peaks don't wrap around
+                scaled = np.multiply(audio_data, np.float32(32767), dtype=np.float32)
+                np.clip(scaled, -32768, 32767, out=scaled)
+                audio_data = scaled.astype(np.int16)
             else:
                 audio_data = audio_data.astype(np.int16)
         
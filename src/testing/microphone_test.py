@@ -5,7 +5,6 @@ Test your microphone by recording and playing back audio
 """
 
 import asyncio
-import subprocess
 import tempfile
 import time
 from pathlib import Path
@@ -21,7 +20,7 @@ import click
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.audio.capture import AudioCapture
-from src.stt.whisper_adapter import WhisperSTT
+from src.audio.dsp_kernels import rms_and_peak
 
 
 class MicrophoneTest:
@@ -34,7 +33,7 @@ class MicrophoneTest:
         self.stt = None
         
     def initialize(self):
-        """Initialize audio components"""
+        """Initialize audio capture (Whisper is loaded on first transcription)"""
         logger.info("🎤 Initializing microphone test...")
         
         # Initialize audio capture
@@ -45,11 +44,16 @@ class MicrophoneTest:
             buffer_size=1024
         )
         
-        # Initialize Whisper for transcription (optional)
-        self.stt = WhisperSTT(model_size="base", language="de")
-        
         logger.success("✅ Microphone test initialized")
     
+    def _init_stt(self):
+        """Load Whisper for transcription, only when a test needs it"""
+        if self.stt is None:
+            # Imported here so device listing and recording don't load torch
+            from src.stt.whisper_adapter import WhisperSTT
+            
+            self.stt = WhisperSTT(model_size="base", language="de")
+    
     async def record_test(self, duration: float = 3.0) -> str:
         """
         Record audio for testing
@@ -66,55 +70,59 @@ class MicrophoneTest:
         # Start audio stream
         self.audio_capture.start_stream()
         
-        # Record audio
-        frames = []
+        # Record audio straight into one buffer; chunks are copied so their
+        # pooled buffers can be reused right away
         chunks_needed = int(duration * 16000 / 1024)  # Calculate chunks needed
+        audio_data = np.empty(chunks_needed * 1024, dtype=np.int16)
+        pos = 0
+        shown_progress = -1
         
         for i in range(chunks_needed):
+            # Waits for the audio callback, which also yields to the event loop
             chunk = await self.audio_capture.capture_async(timeout=1.0)
             if chunk is not None and len(chunk) > 0:
-                frames.append(chunk)
+                n = min(len(chunk), len(audio_data) - pos)
+                audio_data[pos:pos + n] = chunk[:n]
+                pos += n
+                self.audio_capture.release_chunk(chunk)
                 
-                # Show progress
-                progress = (i + 1) / chunks_needed * 100
-                print(f"\r🔴 Recording... {progress:.0f}% ", end="", flush=True)
-            
-            await asyncio.sleep(0.01)
+                # Show progress, only redrawn when the percentage changes
+                progress = round((i + 1) / chunks_needed * 100)
+                if progress != shown_progress:
+                    shown_progress = progress
+                    print(f"\r🔴 Recording... {progress}% ", end="", flush=True)
         
         print("")  # New line after progress
         
         # Stop audio stream
         self.audio_capture.stop_stream()
         
-        if not frames:
+        if pos == 0:
             logger.error("❌ No audio recorded!")
             return ""
         
-        # Combine audio frames
-        audio_data = np.concatenate(frames)
-        
-        # Calculate audio statistics
-        audio_rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
-        audio_max = np.max(np.abs(audio_data))
+        audio_data = audio_data[:pos]
         
-        logger.info(f"📊 Audio stats: RMS={audio_rms:.2f}, Max={audio_max}, Samples={len(audio_data)}")
+        # Calculate audio statistics in one pass over the int16 samples
+        audio_rms, audio_max = rms_and_peak(audio_data)
         
-        # Save to temporary WAV file
-        temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-        wav_path = temp_file.name
-        temp_file.close()
+        logger.info(f"📊 Audio stats: RMS={audio_rms:.2f}, Max={audio_max:.0f}, Samples={len(audio_data)}")
         
-        # Write WAV file
-        with wave.open(wav_path, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(16000)  # 16kHz
-            wav_file.writeframes(audio_data.tobytes())
+        # Save to temporary WAV file, written through the already open handle
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
+            wav_path = temp_file.name
+            
+            with wave.open(temp_file, 'wb') as wav_file:
+                wav_file.setnchannels(1)  # Mono
+                wav_file.setsampwidth(2)  # 16-bit
+                wav_file.setframerate(16000)  # 16kHz
+                # The int16 buffer is written as is, without a bytes copy
+                wav_file.writeframes(audio_data)
         
         logger.success(f"💾 Audio saved to: {wav_path}")
         return wav_path
     
-    def play_audio(self, audio_path: str) -> bool:
+    async def play_audio(self, audio_path: str) -> bool:
         """
         Play back recorded audio
         
@@ -131,14 +139,15 @@ class MicrophoneTest:
         logger.info("🔊 Playing back your recording...")
         
         try:
-            # Use macOS afplay command (built-in)
-            subprocess.run(['afplay', audio_path], check=True)
+            # Use macOS afplay command (built-in), without blocking the event loop
+            proc = await asyncio.create_subprocess_exec('afplay', audio_path)
+            if await proc.wait() != 0:
+                logger.error("❌ Could not play audio file")
+                return False
+            
             logger.success("✅ Playback completed")
             return True
             
-        except subprocess.CalledProcessError:
-            logger.error("❌ Could not play audio file")
-            return False
         except FileNotFoundError:
             logger.error("❌ Audio player not found (afplay)")
             return False
@@ -159,6 +168,9 @@ class MicrophoneTest:
         logger.info("🤖 Transcribing your speech...")
         
         try:
+            if self.stt is None:
+                await asyncio.to_thread(self._init_stt)
+            
             text = await self.stt.transcribe_async(audio_path)
             return text.strip()
         except Exception as e:
@@ -189,7 +201,12 @@ class MicrophoneTest:
         
         input("Press ENTER when ready to hear playback...")
         
-        playback_success = self.play_audio(audio_path)
+        # Transcribe while the recording plays back
+        transcription = None
+        if with_transcription:
+            transcription = asyncio.create_task(self.transcribe_audio(audio_path))
+        
+        playback_success = await self.play_audio(audio_path)
         
         if not playback_success:
             logger.warning("⚠️ Playback failed, but recording might still work")
@@ -200,7 +217,7 @@ class MicrophoneTest:
             logger.info("🤖 SPEECH RECOGNITION TEST:")
             logger.info("="*50)
             
-            text = await self.transcribe_audio(audio_path)
+            text = await transcription
             
             if text:
                 logger.success(f"✅ Recognized: '{text}'")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the audio capture ring buffer
+Feeds samples through the callback side and reads them back like the consumer
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("pyaudio")
+pytest.importorskip("webrtcvad")
+
+from src.audio.capture import AudioCapture, INT16_TO_FLOAT
+
+SAMPLE_RATE = 8000
+BUFFER_SIZE = 256
+
+
+def _stream(start: int, count: int) -> np.ndarray:
+    """Samples numbered by their position in the stream"""
+    return (np.arange(start, start + count) % 32768).astype(np.int16)
+
+
+def _drain(capture: AudioCapture) -> np.ndarray:
+    """Read every unread sample the way capture_async does"""
+    chunks = []
+    while (chunk := capture.get_audio_chunk()) is not None:
+        chunks.append(chunk.copy())
+        capture.release_chunk(chunk)
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int16)
+
+
+@pytest.fixture
+def capture():
+    capture = AudioCapture(sample_rate=SAMPLE_RATE, buffer_size=BUFFER_SIZE)
+    yield capture
+    capture._audio.terminate()
+
+
+def test_read_in_order_across_wraparound(capture):
+    size = len(capture._ring)
+    written = 0
+    read = []
+
+    # Three times around the ring, odd block sizes so writes straddle the end
+    while written < 3 * size:
+        block = _stream(written, 300)
+        capture._write_ring(block)
+        written += len(block)
+        read.append(_drain(capture))
+
+    np.testing.assert_array_equal(np.concatenate(read), _stream(0, written))
+
+
+def test_oversize_write_keeps_newest_samples(capture):
+    size = len(capture._ring)
+    capture._write_ring(_stream(0, 1000))
+    _drain(capture)
+
+    # Larger than the whole ring, starting mid-ring
+    block = _stream(1000, 2 * size + 123)
+    capture._write_ring(block)
+
+    assert capture._ring_pos == capture._head % size
+    np.testing.assert_array_equal(_drain(capture), block[-capture._max_lag:])
+    np.testing.assert_array_equal(capture.get_recent_audio(size), block[-size:])
+
+
+def test_overrun_drops_oldest_samples(capture):
+    total = (len(capture._ring) // BUFFER_SIZE + 5) * BUFFER_SIZE
+    for start in range(0, total, BUFFER_SIZE):
+        capture._write_ring(_stream(start, BUFFER_SIZE))
+
+    np.testing.assert_array_equal(_drain(capture), _stream(total - capture._max_lag, capture._max_lag))
+
+
+def test_recent_audio_and_normalized_mirror(capture):
+    capture._write_ring(_stream(0, 1500))
+
+    assert capture.buffered_samples == 1500
+    np.testing.assert_array_equal(capture.get_recent_audio(500), _stream(1000, 500))
+    np.testing.assert_array_equal(
+        capture.get_recent_audio(500, normalized=True),
+        _stream(1000, 500) * INT16_TO_FLOAT
+    )
+
+    # Capped at what is buffered
+    assert len(capture.get_recent_audio(10 * len(capture._ring))) == 1500
+
+
+def test_recent_audio_copy_is_detached(capture):
+    capture._write_ring(_stream(0, 1000))
+
+    recent = capture.get_recent_audio(500, copy=True)
+    capture._write_ring(_stream(1000, len(capture._ring)))
+
+    np.testing.assert_array_equal(recent, _stream(500, 500))
+
+
+def test_clear_recent_audio(capture):
+    capture._write_ring(_stream(0, 1000))
+    capture.clear_recent_audio()
+
+    assert capture.buffered_samples == 0
+    assert len(capture.get_recent_audio(1000)) == 0
+
+    # Only audio written after the clear is returned
+    capture._write_ring(_stream(1000, 200))
+    assert capture.buffered_samples == 200
+    np.testing.assert_array_equal(capture.get_recent_audio(1000), _stream(1000, 200))
+
+    # Clearing does not touch the consumer cursor
+    np.testing.assert_array_equal(_drain(capture), _stream(0, 1200))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the configuration loader
+Covers config file sections, environment overrides and the section merge
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.config.loader import AudioConfig, ConfigLoader, ENV_OVERRIDES, SECTION_FIELDS, _env_flag
+
+
+CONFIG_DATA = {
+    'audio': {'input_device': 'USB Mic', 'sample_rate': 48000, 'unknown_key': 1},
+    'stt': {'model': 'base'},
+    'wake_word': {'threshold': 0.7},
+    'commands': {'timeout': 3.0, 'test_mode': True, 'test': {'patterns': ['test']}},
+    'system': {'debug': True, 'log_level': 'DEBUG'},
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch, tmp_path):
+    """No environment overrides, and no default config files in the working directory"""
+    for name, *_ in ENV_OVERRIDES:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("true", True),
+    ("TRUE", True),
+    ("1", True),
+    ("yes", True),
+    ("false", None),
+    ("0", None),
+    ("no", None),
+])
+def test_env_flag(value, expected):
+    assert _env_flag(value) is expected
+
+
+def test_defaults_without_config_file():
+    config = ConfigLoader().config
+
+    assert config.audio == AudioConfig()
+    assert config.stt.model == "small"
+    assert not config.debug
+
+
+@pytest.mark.parametrize("suffix,dump", [
+    (".yml", yaml.safe_dump),
+    (".json", json.dumps),
+])
+def test_load_config_file(tmp_path, suffix, dump):
+    path = tmp_path / f"settings{suffix}"
+    path.write_text(dump(CONFIG_DATA), encoding="utf-8")
+
+    config = ConfigLoader(path).config
+
+    assert config.audio.input_device == "USB Mic"
+    assert config.audio.sample_rate == 48000
+    assert config.audio.channels == 1
+    assert config.stt.model == "base"
+    assert config.stt.language == "de"
+    assert config.wake_word.threshold == 0.7
+    assert config.commands.timeout == 3.0
+    assert config.commands.custom_commands == CONFIG_DATA['commands']
+    assert config.debug
+    assert config.log_level == "DEBUG"
+
+
+def test_global_settings_at_root_level(tmp_path):
+    path = tmp_path / "settings.yml"
+    path.write_text(yaml.safe_dump({'dry_run': True, 'log_level': 'WARNING'}), encoding="utf-8")
+
+    config = ConfigLoader(path).config
+
+    assert config.dry_run
+    assert config.log_level == "WARNING"
+
+
+def test_invalid_config_file_uses_defaults(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert ConfigLoader(path).config.audio == AudioConfig()
+
+
+def test_merge_ignores_unknown_keys():
+    section = AudioConfig()
+    merged = ConfigLoader._merge(section, {'sample_rate': 44100, 'unknown_key': 1}, SECTION_FIELDS['audio'])
+
+    assert merged == AudioConfig(sample_rate=44100)
+    assert section == AudioConfig()
+
+
+def test_env_overrides(monkeypatch):
+    monkeypatch.setenv('AUDIO_DEVICE', 'Scarlett')
+    monkeypatch.setenv('STT_LANGUAGE', 'en')
+    monkeypatch.setenv('STT_MODEL', 'tiny')
+    monkeypatch.setenv('AUDIO_SAMPLE_RATE', '44100')
+    monkeypatch.setenv('DEBUG_MODE', 'yes')
+    monkeypatch.setenv('DRY_RUN', '1')
+    monkeypatch.setenv('LOG_LEVEL', 'debug')
+
+    config = ConfigLoader().config
+
+    assert config.audio.input_device == "Scarlett"
+    assert config.stt.language == "en"
+    assert config.stt.model == "tiny"
+    assert config.audio.sample_rate == 44100
+    assert config.debug
+    assert config.dry_run
+    assert config.log_level == "DEBUG"
+
+
+def test_env_overrides_skip_invalid_and_false_values(monkeypatch):
+    monkeypatch.setenv('AUDIO_SAMPLE_RATE', 'fast')
+    monkeypatch.setenv('DEBUG_MODE', 'false')
+    monkeypatch.setenv('STT_MODEL', '')
+
+    config = ConfigLoader().config
+
+    assert config.audio.sample_rate == 16000
+    assert not config.debug
+    assert config.stt.model == "small"
+
+
+def test_env_overrides_apply_over_config_file(tmp_path, monkeypatch):
+    path = tmp_path / "settings.yml"
+    path.write_text(yaml.safe_dump(CONFIG_DATA), encoding="utf-8")
+    monkeypatch.setenv('STT_MODEL', 'medium')
+
+    config = ConfigLoader(path).config
+
+    assert config.stt.model == "medium"
+    assert config.audio.input_device == "USB Mic"
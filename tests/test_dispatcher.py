@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for the command dispatcher
+Covers the bounded history, inline versus threaded execution and key parsing
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.nlu.parser import Intent
+from src.router.dispatcher import CommandDispatcher, CommandResult, HISTORY_SIZE, _parse_keys
+
+
+def _intent(name: str = "test", action=None, feedback: str = "") -> Intent:
+    return Intent(name=name, confidence=1.0, text=name, slots={}, action=action, feedback=feedback)
+
+
+KEY_ACTION = {"type": "key_command", "value": "Space"}
+SCRIPT_ACTION = {"type": "applescript", "value": 'tell application "Logic Pro" to activate'}
+
+
+def test_history_is_bounded():
+    dispatcher = CommandDispatcher(dry_run=True)
+    for index in range(HISTORY_SIZE + 5):
+        dispatcher.execute(_intent(f"cmd{index}", action="log"))
+
+    history = dispatcher.get_history()
+    assert len(history) == HISTORY_SIZE
+    assert history[0]['intent'] == "cmd5"
+    assert history[-1]['intent'] == f"cmd{HISTORY_SIZE + 4}"
+    assert history[-1]['text'] == f"cmd{HISTORY_SIZE + 4}"
+
+    dispatcher.clear_history()
+    assert dispatcher.get_history() == []
+
+
+def test_execute_without_intent():
+    result = CommandDispatcher(dry_run=True).execute(None)
+
+    assert not result.success
+    assert result.error == "No intent provided"
+
+
+@pytest.mark.parametrize("action,feedback,expected", [
+    ("log", "Test erfolgreich", "Test erfolgreich"),
+    ("log", "", "Befehl test ausgeführt"),
+    ("exit", "", "Auf Wiedersehen"),
+    (None, "", "Befehl test erkannt"),
+    (KEY_ACTION, "Play", "[TEST] Play"),
+    (SCRIPT_ACTION, "", "[TEST] AppleScript ausgeführt"),
+])
+def test_execute_feedback(action, feedback, expected):
+    result = CommandDispatcher(dry_run=True).execute(_intent(action=action, feedback=feedback))
+
+    assert result.success
+    assert result.feedback == expected
+
+
+def test_execute_time():
+    result = CommandDispatcher(dry_run=True).execute(_intent("time", action="time", feedback="Es ist {time}"))
+
+    assert result.success
+    assert result.feedback == f"Es ist {result.data['time']}"
+
+
+@pytest.mark.parametrize("action", ["unknown", {"type": "unknown"}])
+def test_execute_unknown_action(action):
+    result = CommandDispatcher(dry_run=True).execute(_intent(action=action))
+
+    assert not result.success
+    assert "unknown" in result.error
+
+
+@pytest.mark.parametrize("dry_run,action,blocking", [
+    (False, KEY_ACTION, True),
+    (False, SCRIPT_ACTION, True),
+    (True, KEY_ACTION, False),
+    (True, SCRIPT_ACTION, False),
+    (False, "log", False),
+    (False, "time", False),
+    (False, {"type": "unknown"}, False),
+    (False, None, False),
+])
+def test_is_blocking(dry_run, action, blocking):
+    assert CommandDispatcher(dry_run=dry_run)._is_blocking(_intent(action=action)) is blocking
+
+
+def test_is_blocking_without_intent():
+    assert CommandDispatcher(dry_run=False)._is_blocking(None) is False
+
+
+@pytest.mark.parametrize("action,inline", [("log", True), (KEY_ACTION, False)])
+def test_execute_async_thread(monkeypatch, action, inline):
+    dispatcher = CommandDispatcher(dry_run=False)
+    threads = []
+
+    def send_key_command(keys, intent):
+        threads.append(threading.get_ident())
+        return CommandResult(success=True, feedback="sent")
+
+    def execute_simple_action(simple_action, intent):
+        threads.append(threading.get_ident())
+        return CommandResult(success=True, feedback="logged")
+
+    monkeypatch.setattr(dispatcher, "_send_key_command", send_key_command)
+    monkeypatch.setattr(dispatcher, "_execute_simple_action", execute_simple_action)
+
+    result = asyncio.run(dispatcher.execute_async(_intent(action=action)))
+
+    assert result.success
+    assert (threads == [threading.get_ident()]) is inline
+
+
+@pytest.mark.parametrize("keys,expected", [
+    ("Space", ("space",)),
+    ("R", ("R",)),
+    ("Cmd+S", ("command", "S")),
+    ("Cmd+Shift+S", ("command", "shift", "S")),
+])
+def test_parse_keys(keys, expected):
+    assert _parse_keys(keys) == expected
+
+
+def test_parse_keys_is_cached():
+    _parse_keys.cache_clear()
+    _parse_keys("Cmd+Shift+N")
+    _parse_keys("Cmd+Shift+N")
+
+    info = _parse_keys.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
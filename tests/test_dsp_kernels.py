@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the DSP kernels
+Checks the loop kernels, the NumPy fallbacks and the exported functions against plain NumPy
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.audio.dsp_kernels import (
+    _rms_and_peak_loop,
+    _rms_and_peak_numpy,
+    _rms_and_zcr_loop,
+    _rms_and_zcr_numpy,
+    rms_and_peak,
+    rms_and_zcr,
+)
+
+
+def _signals():
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 3000, 4000)
+    return {
+        "int16 noise": np.clip(noise, -32768, 32767).astype(np.int16),
+        "int16 full scale": np.array([-32768, 32767, -32768, 0, 1, -1], dtype=np.int16),
+        "int16 silence": np.zeros(512, dtype=np.int16),
+        "float32 noise": (noise / 32768).astype(np.float32),
+        "float64 sine": np.sin(np.linspace(0, 20 * np.pi, 1000, endpoint=False)),
+        "single sample": np.array([-7], dtype=np.int16),
+    }
+
+
+SIGNALS = _signals()
+
+ZCR_KERNELS = [_rms_and_zcr_loop, _rms_and_zcr_numpy, rms_and_zcr]
+PEAK_KERNELS = [_rms_and_peak_loop, _rms_and_peak_numpy, rms_and_peak]
+
+
+def _reference_rms(audio: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(audio.astype(np.float64) ** 2)))
+
+
+@pytest.mark.parametrize("kernel", ZCR_KERNELS)
+@pytest.mark.parametrize("name", SIGNALS)
+def test_rms_and_zcr(kernel, name):
+    audio = SIGNALS[name]
+    negative = audio < 0
+
+    rms, crossings = kernel(audio)
+
+    assert rms == pytest.approx(_reference_rms(audio), rel=1e-6)
+    assert crossings == int(np.count_nonzero(negative[1:] != negative[:-1]))
+
+
+@pytest.mark.parametrize("kernel", PEAK_KERNELS)
+@pytest.mark.parametrize("name", SIGNALS)
+def test_rms_and_peak(kernel, name):
+    audio = SIGNALS[name]
+
+    rms, peak = kernel(audio)
+
+    assert rms == pytest.approx(_reference_rms(audio), rel=1e-6)
+    assert peak == pytest.approx(float(np.max(np.abs(audio.astype(np.float64)))), rel=1e-6)
+
+
+@pytest.mark.parametrize("kernel", ZCR_KERNELS + PEAK_KERNELS)
+def test_empty_input(kernel):
+    rms, second = kernel(np.empty(0, dtype=np.int16))
+
+    assert rms == 0.0
+    assert second == 0
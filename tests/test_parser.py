@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the intent parser
+Pins intent and confidence for the default and config.yml command sets
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.nlu.parser import IntentParser
+
+
+def _config_commands(test_mode: bool) -> dict:
+    """Commands section of config.yml"""
+    with open(ROOT / "config.yml", encoding="utf-8") as f:
+        commands = yaml.safe_load(f)["commands"]
+    return dict(commands, test_mode=test_mode)
+
+
+# Phrase -> (intent, confidence) or None, per command set
+EXPECTED = {
+    "default": {
+        "test": ("test", 1.0),
+        "teste das system": ("test", 0.9),
+        "tset": ("test", 0.75),
+        "testen bitte": ("test", 0.9),
+        "Hallo!": ("hello", 1.0),
+        "halo": ("hello", 0.8889),
+        "hallo wie geht es": ("hello", 0.9),
+        "servus leute": ("hello", 0.9),
+        "hilf mir": ("hello", 0.9),
+        "stop bitte": ("stop", 0.9),
+        "stob": ("stop", 0.75),
+        "beende": ("stop", 0.9231),
+        "hilfe": ("help", 1.0),
+        "hillfe": ("help", 0.9091),
+        "was kannst du": ("help", 1.0),
+        "bitte": None,
+        "mitte": None,
+        "spiele musik": None,
+        "zeit": None,
+        "play": None,
+    },
+    "config": {
+        "test": ("test", 1.0),
+        "tset": ("test", 0.75),
+        "halo": ("hello", 0.8889),
+        "hilfe": ("hello", 0.9),
+        "hillfe": ("hello", 0.9),
+        "stob": ("stop", 0.75),
+        "beende": ("stop", 0.9231),
+        "zeit": ("time", 1.0),
+        "uhrzeiten": ("time", 0.9),
+        "wie spät ist es": ("time", 0.9),
+        "bitte": None,
+        "mitte": None,
+        "servus leute": None,
+        "was kannst du": None,
+        "abspiele": None,
+        "ufnahme": None,
+    },
+    "production": {
+        "test": ("test", 1.0),
+        "halo": ("hello", 0.8889),
+        "zeit": ("time", 1.0),
+        "play": ("play", 1.0),
+        "abspiele": ("play", 0.9412),
+        "starte die aufnahme": ("play", 0.9),
+        "aufnahme starten": ("play", 0.9),
+        "ufnahme": ("record", 0.9333),
+        "bitte": None,
+        "mitte": None,
+        "spiele musik": None,
+        "rückgängig": None,
+    },
+}
+
+COMMAND_SETS = {
+    "default": lambda: None,
+    "config": lambda: _config_commands(test_mode=True),
+    "production": lambda: _config_commands(test_mode=False),
+}
+
+CASES = [
+    (command_set, phrase, expected)
+    for command_set, phrases in EXPECTED.items()
+    for phrase, expected in phrases.items()
+]
+
+
+@pytest.fixture(scope="module")
+def parsers():
+    return {name: IntentParser(config()) for name, config in COMMAND_SETS.items()}
+
+
+@pytest.mark.parametrize("command_set,phrase,expected", CASES)
+def test_parse_pinned(parsers, command_set, phrase, expected):
+    intent = parsers[command_set].parse(phrase)
+
+    if expected is None:
+        assert intent is None
+    else:
+        assert intent is not None
+        assert intent.name == expected[0]
+        assert intent.confidence == pytest.approx(expected[1], abs=1e-4)
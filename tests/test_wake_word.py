@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the wake word detector
+Pins detection results for the default wake words, including near misses
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.audio.wake_word import WakeWordDetector
+
+
+# Phrase -> detected, per threshold
+EXPECTED = {
+    0.6: {
+        "hey logik!": True,
+        "halo logic": True,
+        "Computer, öffne das Projekt": True,
+        "Logic Pro ist super": True,
+        "hey kompjuter": True,
+        "aufnahme starte": True,
+        "aufnahme leiser": True,
+        "komm puter": True,
+        "logig": True,
+        "magic": True,
+        "Das ist ein Test": False,
+        "hey": False,
+        "hey du": False,
+        # Near misses: rapidfuzz's fuzz.ratio alone scores these above 0.6
+        "noch das starten": False,
+        "aufnahme danke gut": False,
+        "hallo noch genau starten": False,
+        "es aufnahme jetzt test": False,
+        "aufnahme tuundt geht es": False,
+    },
+    0.8: {
+        "hey logik!": True,
+        "halo logic": True,
+        "logisch": True,
+        "hey kompjuter": True,
+        "aufnahme starte": True,
+        "aufnahme leiser": False,
+        "komm puter": False,
+        "magic": False,
+        "hallo": False,
+        "starten": False,
+    },
+}
+
+CASES = [
+    (threshold, phrase, expected)
+    for threshold, phrases in EXPECTED.items()
+    for phrase, expected in phrases.items()
+]
+
+
+@pytest.fixture(scope="module")
+def detectors():
+    return {threshold: WakeWordDetector(threshold=threshold) for threshold in EXPECTED}
+
+
+@pytest.mark.parametrize("threshold,phrase,expected", CASES)
+def test_detect_in_text_pinned(detectors, threshold, phrase, expected):
+    assert detectors[threshold].detect_in_text(phrase) is expected